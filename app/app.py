@@ -19,10 +19,9 @@ st.set_page_config(
 project_root = Path(__file__).parent
 sys.path.append(str(project_root))
 
-try:
-    from controllers.app_controller import AuthenticatedBankingRatesController
-    from auth.auth_manager import SessionStateManager, create_sample_config
-except ImportError as e:
+
+def show_import_error(e: ImportError):
+    """Show dependency help when a project module fails to import"""
     st.error(f"Import error: {e}")
     st.info("Please ensure all required modules are available in the project directory.")
     
@@ -40,6 +39,24 @@ except ImportError as e:
     st.stop()
 
 
+try:
+    from auth.auth_manager import SessionStateManager
+except ImportError as e:
+    show_import_error(e)
+
+
+@st.cache_data
+def _sample_yaml_text() -> str:
+    """Serialize the sample config once per process"""
+    import yaml
+    from auth.auth_manager import create_sample_config
+    return yaml.dump(
+        create_sample_config(),
+        default_flow_style=False,
+        Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+    )
+
+
 def check_config_file():
     """Check if config.yaml exists and help create it if not"""
     config_path = "config.yaml"
@@ -55,9 +72,7 @@ def check_config_file():
             """)
             
             # Show sample config
-            sample_config = create_sample_config()
-            import yaml
-            sample_yaml = yaml.dump(sample_config, default_flow_style=False)
+            sample_yaml = _sample_yaml_text()
             st.code(sample_yaml, language='yaml')
             
             st.markdown("""
@@ -159,6 +174,11 @@ def main():
             if not show_setup_help():
                 st.stop()
         
+        try:
+            from controllers.app_controller import AuthenticatedBankingRatesController
+        except ImportError as e:
+            show_import_error(e)
+        
         with st.spinner("Loading Banking Rates Dashboard..."):
             app_controller = AuthenticatedBankingRatesController()
             st.session_state.app_initialized = True
@@ -6,17 +6,56 @@ Handles user authentication, session management, and logging
 import streamlit as st
 import streamlit_authenticator as stauth
 import yaml
-from yaml.loader import SafeLoader
 import logging
+import logging.handlers
 import os
+import copy
+import functools
+import queue
+import atexit
 from datetime import datetime
 from typing import Optional, Dict, Any
 from pathlib import Path
 
+# Prefer libyaml's C loader when available, fall back to the pure-Python one
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+usage_logger = logging.getLogger("usage")
+
+
+@functools.lru_cache(maxsize=None)
+def _ensure_log_header(path: str) -> None:
+    """Create the usage log with its CSV header, once per process"""
+    try:
+        with open(path, "x") as f:
+            f.write("timestamp,username,event,visit_count\n")
+    except FileExistsError:
+        pass
+
+
+@st.cache_data(show_spinner=False)
+def _load_yaml_config(path: str, mtime: float) -> Dict[str, Any]:
+    """Parse config.yaml once per file version; each caller gets its own copy to mutate"""
+    with open(path, encoding="utf-8") as file:
+        return yaml.load(file, Loader=Loader)
+
+
+@st.cache_data(ttl=5)
+def _read_log_tail(path: str, mtime: float, max_bytes: int) -> str:
+    """Read only the last max_bytes of the log, trimmed to a whole line"""
+    with open(path, "rb") as f:
+        f.seek(0, 2)
+        size = f.tell()
+        f.seek(max(0, size - max_bytes))
+        data = f.read().decode("utf-8", "replace")
+    return data[data.find("\n") + 1:] if size > max_bytes else data
+
 
 class AuthenticationManager:
     """Manages user authentication and session state"""
     
+    _logging_initialized = False
+    
     def __init__(self, config_path: str = "config.yaml", log_file: str = "usage.log", allow_guest: bool = True):
         self.config_path = config_path
         self.log_file = log_file
@@ -28,21 +67,28 @@ class AuthenticationManager:
     
     def _setup_logging(self):
         """Setup logging for user activities"""
-        if not os.path.exists(self.log_file):
-            with open(self.log_file, "w") as f:
-                f.write("timestamp,username,event,visit_count\n")
-        logging.basicConfig(
-            filename=self.log_file,
-            level=logging.INFO,
-            format="%(asctime)s,%(message)s",
+        if AuthenticationManager._logging_initialized:
+            return
+        _ensure_log_header(self.log_file)
+        file_handler = logging.FileHandler(self.log_file)
+        file_handler.setFormatter(logging.Formatter(
+            "%(asctime)s,%(message)s",
             datefmt="%Y-%m-%d %H:%M:%S"
-        )
+        ))
+        log_queue = queue.Queue(-1)
+        listener = logging.handlers.QueueListener(log_queue, file_handler)
+        listener.start()
+        atexit.register(listener.stop)
+        # Dedicated logger so the app-wide root handler reset doesn't drop usage events
+        usage_logger.setLevel(logging.INFO)
+        usage_logger.propagate = False
+        usage_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        AuthenticationManager._logging_initialized = True
     
     def _load_config(self):
         """Load authentication configuration"""
         try:
-            with open(self.config_path) as file:
-                self.config = yaml.load(file, Loader=SafeLoader)
+            self.config = _load_yaml_config(self.config_path, os.path.getmtime(self.config_path))
         except FileNotFoundError:
             st.error(f"Configuration file '{self.config_path}' not found.")
             st.info("Please create a config.yaml file with authentication settings.")
@@ -54,6 +100,7 @@ class AuthenticationManager:
     def _initialize_authenticator(self):
         """Initialize the Streamlit authenticator"""
         try:
+            # Built every run: Authenticate seeds this session's state and renders the cookie component
             self.authenticator = stauth.Authenticate(
                 self.config['credentials'],
                 self.config['cookie']['name'],
@@ -86,18 +133,21 @@ class AuthenticationManager:
             st.session_state.visit_count = 1
         else:
             st.session_state.visit_count += 1
-        logging.info(f'guest,login,{st.session_state.visit_count}')
+        usage_logger.info('%s,login,%d', 'guest', st.session_state.visit_count)
+        self._stamp_last_login()
         st.session_state['login_processed'] = True
         st.rerun()
     
     def is_authenticated(self) -> bool:
         """Check if user is authenticated (including guest)"""
-        auth_status = st.session_state.get("authentication_status", False)
+        ss = st.session_state
+        auth_status = ss.get("authentication_status", False)
         return auth_status is True or auth_status == "guest"
     
     def is_guest(self) -> bool:
         """Check if current user is a guest"""
-        return st.session_state.get("is_guest", False)
+        ss = st.session_state
+        return ss.get("is_guest", False)
     
     def is_regular_user(self) -> bool:
         """Check if current user is a regular authenticated user (not guest)"""
@@ -109,28 +159,38 @@ class AuthenticationManager:
     
     def get_current_user(self) -> Optional[str]:
         """Get current authenticated user"""
-        if self.is_authenticated():
-            return st.session_state.get("username")
+        ss = st.session_state
+        auth_status = ss.get("authentication_status", False)
+        if auth_status is True or auth_status == "guest":
+            return ss.get("username")
         return None
     
     def get_current_user_name(self) -> Optional[str]:
         """Get current authenticated user's display name"""
-        if self.is_authenticated():
-            return st.session_state.get("name")
+        ss = st.session_state
+        auth_status = ss.get("authentication_status", False)
+        if auth_status is True or auth_status == "guest":
+            return ss.get("name")
         return None
     
     def process_login(self):
         """Process login and handle session management"""
-        if self.is_authenticated() and 'login_processed' not in st.session_state:
-            if "visit_count" not in st.session_state:
-                st.session_state.visit_count = 1
-            else:
-                st.session_state.visit_count += 1
+        if st.session_state.get('login_processed'):
+            return
+        if self.is_authenticated():
+            visit_count = st.session_state.get('visit_count', 0) + 1
+            st.session_state['visit_count'] = visit_count
             username = self.get_current_user()
-            visit_count = st.session_state.visit_count
-            logging.info(f'{username},login,{visit_count}')
+            usage_logger.info('%s,login,%d', username, visit_count)
+            self._stamp_last_login()
             st.session_state['login_processed'] = True
     
+    def _stamp_last_login(self):
+        """Format the last login caption once at login time"""
+        last_login = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        st.session_state['last_login'] = last_login
+        st.session_state['last_login_str'] = f"Last login: {last_login}"
+    
     def show_logout_button(self, location: str = 'sidebar'):
         """Show logout button and handle logout logic"""
         if self.is_authenticated():
@@ -148,18 +208,16 @@ class AuthenticationManager:
     
     def _logout_guest(self):
         """Handle guest logout"""
-        guest_keys = ['authentication_status', 'username', 'name', 'is_guest', 
-                     'login_processed', 'visit_count', 'last_login']
-        for key in guest_keys:
-            if key in st.session_state:
-                del st.session_state[key]
-        logging.info('guest,logout,0')
+        for key in _GUEST_LOGOUT_KEYS:
+            st.session_state.pop(key, None)
+        usage_logger.info('%s,logout,%d', 'guest', 0)
         st.rerun()
     
     def cleanup_session_on_failed_auth(self):
         """Clean up session state on failed authentication"""
         if 'login_processed' in st.session_state:
             del st.session_state['login_processed']
+        st.session_state.pop('_sections_cache', None)
     
     def render_user_info_sidebar(self):
         """Render user information in sidebar"""
@@ -174,9 +232,7 @@ class AuthenticationManager:
                 if self.is_guest():
                     st.warning("⚠️ Limited access as guest")
                 self.show_logout_button('sidebar')
-                if 'last_login' not in st.session_state:
-                    st.session_state.last_login = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                st.caption(f"Last login: {st.session_state.last_login}")
+                st.caption(st.session_state.get('last_login_str', ''))
     
     def get_user_logs(self) -> str:
         """Get user activity logs"""
@@ -186,22 +242,78 @@ class AuthenticationManager:
         except FileNotFoundError:
             return "No logs available"
     
+    def get_user_logs_tail(self, max_bytes: int = 64 * 1024) -> str:
+        """Get the most recent user activity logs"""
+        try:
+            return _read_log_tail(self.log_file, os.path.getmtime(self.log_file), max_bytes)
+        except FileNotFoundError:
+            return "No logs available"
+    
     def show_logs_expander(self):
         """Show logs in an expander (only for non-guest users)"""
         if self.is_authenticated() and not self.is_guest():
             with st.expander("📜 View Activity Log"):
-                logs = self.get_user_logs()
+                logs = self.get_user_logs_tail()
                 st.text_area("Session Log", logs, height=200)
 
 
+ROLE_PERMISSIONS = {
+    'admin': frozenset({'view_data', 'download_data', 'create_custom_rates', 'view_logs', 'manage_users'}),
+    'power_user': frozenset({'view_data', 'download_data', 'create_custom_rates'}),
+    'user': frozenset({'view_data', 'download_data'}),
+    'guest': frozenset({'view_data', 'download_data'})
+}
+_EMPTY = frozenset()
+
+_AUTH_KEYS_FROZENSET = frozenset([
+    'authentication_status',
+    'username',
+    'name',
+    'login_processed',
+    'visit_count',
+    'last_login',
+    'last_login_str',
+    'is_guest',
+    '_sections_cache'
+])
+_GUEST_LOGOUT_KEYS = _AUTH_KEYS_FROZENSET
+_GUEST_ALLOWED_SECTIONS = frozenset({"📊 Dashboard", "📈 Rates View"})
+_AUTH_SESSION_DEFAULTS = (
+    ('authentication_status', None),
+    ('username', None),
+    ('name', None),
+    ('login_processed', None),
+    ('visit_count', 0),
+    ('last_login', None),
+    ('is_guest', False)
+)
+
+
+def get_auth_manager(config_path: str = "config.yaml", log_file: str = "usage.log",
+                     allow_guest: bool = True) -> AuthenticationManager:
+    """Build a new authentication manager on every run, deliberately uncached: it holds this session's authenticator state"""
+    return AuthenticationManager(config_path=config_path, log_file=log_file, allow_guest=allow_guest)
+
+
 class UserPermissionManager:
     """Manages user permissions and role-based access"""
     
+    ROLE_PERMISSIONS = ROLE_PERMISSIONS
+    
     def __init__(self, config: Dict[str, Any]):
         self.config = config
+        self._role_cache: Dict[str, str] = {}
     
     def get_user_role(self, username: str) -> str:
         """Get user role from configuration"""
+        role = self._role_cache.get(username)
+        if role is None:
+            role = self._lookup_user_role(username)
+            self._role_cache[username] = role
+        return role
+    
+    def _lookup_user_role(self, username: str) -> str:
+        """Resolve user role from the credentials section"""
         if username == "guest":
             return "guest"
         try:
@@ -212,21 +324,13 @@ class UserPermissionManager:
     
     def has_permission(self, username: str, permission: str) -> bool:
         """Check if user has specific permission"""
-        role = self.get_user_role(username)
-        role_permissions = {
-            'admin': ['view_data', 'download_data', 'create_custom_rates', 'view_logs', 'manage_users'],
-            'power_user': ['view_data', 'download_data', 'create_custom_rates'],
-            'user': ['view_data', 'download_data'],
-            'guest': ['view_data','download_data']
-        }
-        return permission in role_permissions.get(role, [])
+        return permission in self.ROLE_PERMISSIONS.get(self.get_user_role(username), _EMPTY)
     
     def filter_available_sections(self, username: str, sections: list) -> list:
         """Filter available sections based on user permissions"""
         role = self.get_user_role(username)
         if role == 'guest':
-            allowed_sections = ["📊 Dashboard", "📈 Rates View"]
-            return [s for s in sections if s in allowed_sections]
+            return [s for s in sections if s in _GUEST_ALLOWED_SECTIONS]
         elif self.has_permission(username, 'view_logs'):
             return sections
         else:
@@ -239,70 +343,48 @@ class SessionStateManager:
     @staticmethod
     def initialize_auth_session():
         """Initialize authentication-related session variables"""
-        auth_keys = [
-            'authentication_status',
-            'username', 
-            'name',
-            'login_processed',
-            'visit_count',
-            'last_login',
-            'is_guest'
-        ]
-        for key in auth_keys:
+        for key, default in _AUTH_SESSION_DEFAULTS:
             if key not in st.session_state:
-                if key == 'visit_count':
-                    st.session_state[key] = 0
-                elif key == 'is_guest':
-                    st.session_state[key] = False
-                else:
-                    st.session_state[key] = None
+                st.session_state[key] = default
     
     @staticmethod
     def clear_auth_session():
         """Clear authentication session data"""
-        auth_keys = [
-            'authentication_status',
-            'username',
-            'name', 
-            'login_processed',
-            'visit_count',
-            'last_login',
-            'is_guest'
-        ]
-        for key in auth_keys:
-            if key in st.session_state:
-                del st.session_state[key]
+        for key in _AUTH_KEYS_FROZENSET:
+            st.session_state.pop(key, None)
     
     @staticmethod
     def reset_session():
         """Reset entire session state"""
-        for key in list(st.session_state.keys()):
-            del st.session_state[key]
+        st.session_state.clear()
 
 
-def create_sample_config():
-    """Create a sample config.yaml file for reference"""
-    sample_config = {
-        'credentials': {
-            'usernames': {
-                'admin': {
-                    'email': 'admin@example.com',
-                    'name': 'Administrator',
-                    'password': '$2b$12$...',
-                    'role': 'admin'
-                },
-                'user1': {
-                    'email': 'user1@example.com', 
-                    'name': 'Regular User',
-                    'password': '$2b$12$...',
-                    'role': 'user'
-                }
+_SAMPLE_CONFIG = {
+    'credentials': {
+        'usernames': {
+            'admin': {
+                'email': 'admin@example.com',
+                'name': 'Administrator',
+                'password': '$2b$12$...',
+                'role': 'admin'
+            },
+            'user1': {
+                'email': 'user1@example.com', 
+                'name': 'Regular User',
+                'password': '$2b$12$...',
+                'role': 'user'
             }
-        },
-        'cookie': {
-            'name': 'banking_rates_auth',
-            'key': 'random_signature_key_here',
-            'expiry_days': 30
         }
+    },
+    'cookie': {
+        'name': 'banking_rates_auth',
+        'key': 'random_signature_key_here',
+        'expiry_days': 30
     }
-    return sample_config
+}
+
+
+def create_sample_config():
+    """Create a sample config.yaml file for reference"""
+    # Deep copy so callers can add users without altering the shared template
+    return copy.deepcopy(_SAMPLE_CONFIG)
@@ -4,35 +4,53 @@ Handles all session state initialization to prevent attribute errors
 """
 
 import streamlit as st
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional
 from constants.defaults import DEFAULT_SESSION_STATE
 
 
+SECTION_KEYS = {
+    'auth': ('authentication_status', 'username', 'name', 'login_processed'),
+    'data': ('custom_rates', 'selected_choice', 'data_refresh_needed'),
+    'ui': ('show_advanced_options', 'chart_preferences', 'sidebar_state'),
+    'errors': ('last_error', 'error_count', 'error_history')
+}
+
+
 class SessionStateManager:
     """Session state manager with comprehensive initialization"""
     DEFAULT_SESSION_STATE = DEFAULT_SESSION_STATE
+    _DEFAULT_ITEMS = tuple(DEFAULT_SESSION_STATE.items())
 
     @classmethod
     def initialize_all_session_state(cls):
         """Initialize all session state variables with safe defaults"""
-        for key, default_value in cls.DEFAULT_SESSION_STATE.items():
+        if st.session_state.get("_ss_inited"):
+            return
+        for key, default_value in cls._DEFAULT_ITEMS:
             if key not in st.session_state:
                 if isinstance(default_value, (dict, list)):
-                    import copy
-                    st.session_state[key] = copy.deepcopy(default_value)
+                    st.session_state[key] = default_value.copy()
                 else:
                     st.session_state[key] = default_value
+        st.session_state["_ss_inited"] = True
+    
+    @classmethod
+    def force_reinit(cls):
+        """Clear the initialization sentinel and re-seed missing defaults"""
+        st.session_state.pop("_ss_inited", None)
+        cls.initialize_all_session_state()
     
     @classmethod
     def safe_get(cls, key: str, default: Any = None) -> Any:
         """Safely get a session state value with fallback"""
         try:
-            if key in st.session_state:
-                return st.session_state[key]
+            ss = st.session_state
+            if key in ss:
+                return ss[key]
             else:
                 default_value = cls.DEFAULT_SESSION_STATE.get(key, default)
-                st.session_state[key] = default_value
+                ss[key] = default_value
                 return default_value
         except Exception:
             return default
@@ -49,15 +67,8 @@ class SessionStateManager:
     @classmethod
     def reset_section(cls, section: str):
         """Reset session state for a specific section"""
-        section_keys = {
-            'auth': ['authentication_status', 'username', 'name', 'login_processed'],
-            'data': ['custom_rates', 'selected_choice', 'data_refresh_needed'],
-            'ui': ['show_advanced_options', 'chart_preferences', 'sidebar_state'],
-            'errors': ['last_error', 'error_count', 'error_history']
-        }
-        
-        if section in section_keys:
-            for key in section_keys[section]:
+        if section in SECTION_KEYS:
+            for key in SECTION_KEYS[section]:
                 if key in cls.DEFAULT_SESSION_STATE:
                     cls.safe_set(key, cls.DEFAULT_SESSION_STATE[key])
     
@@ -69,10 +80,10 @@ class SessionStateManager:
             'message': message,
             'type': type,
             'timestamp': datetime.now(),
-            'id': len(notifications)
+            'id': cls.increment_counter('_notif_seq')
         }
+        # The list lives in session state already, so appending is enough
         notifications.append(notification)
-        cls.safe_set('notifications', notifications)
     
     @classmethod
     def clear_notifications(cls):
@@ -118,24 +129,20 @@ class SessionStateManager:
     @classmethod
     def cleanup_old_data(cls, max_age_hours: int = 24):
         """Clean up old data from session state"""
-        current_time = datetime.now()
+        cutoff = datetime.now() - timedelta(hours=max_age_hours)
         
         notifications = cls.safe_get('notifications', [])
-        fresh_notifications = []
-        for notif in notifications:
-            if hasattr(notif, 'timestamp'):
-                age = (current_time - notif['timestamp']).total_seconds() / 3600
-                if age < max_age_hours:
-                    fresh_notifications.append(notif)
+        fresh_notifications = [
+            notif for notif in notifications
+            if 'timestamp' in notif and notif['timestamp'] > cutoff
+        ]
         cls.safe_set('notifications', fresh_notifications)
         
         error_history = cls.safe_get('error_history', [])
-        fresh_errors = []
-        for error in error_history:
-            if hasattr(error, 'timestamp'):
-                age = (current_time - error['timestamp']).total_seconds() / 3600
-                if age < max_age_hours:
-                    fresh_errors.append(error)
+        fresh_errors = [
+            error for error in error_history
+            if 'timestamp' in error and error['timestamp'] > cutoff
+        ]
         cls.safe_set('error_history', fresh_errors)
 
 
@@ -158,7 +165,7 @@ class SessionStateDecorator:
                 return func(*args, **kwargs)
             except AttributeError as e:
                 if "session_state" in str(e):
-                    SessionStateManager.initialize_all_session_state()
+                    SessionStateManager.force_reinit()
                     return func(*args, **kwargs)
                 else:
                     raise e
@@ -1,3 +1,4 @@
+# deprecated: prefer the flat lookups below for new code
 FRED_SERIES_REGISTRY = {
     "Fed Funds Rate": {
         "series_id": "FEDFUNDS",
@@ -44,3 +45,9 @@ FRED_SERIES_REGISTRY = {
         "source": "https://fred.stlouisfed.org/series/GS1M"
     }
 }
+
+
+FRED_NAMES = tuple(FRED_SERIES_REGISTRY)
+FRED_SERIES_IDS = tuple(v["series_id"] for v in FRED_SERIES_REGISTRY.values())
+FRED_SOURCES = tuple(v["source"] for v in FRED_SERIES_REGISTRY.values())
+NAME_TO_SERIES_ID = {n: FRED_SERIES_IDS[i] for i, n in enumerate(FRED_NAMES)}
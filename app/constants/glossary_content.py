@@ -1,161 +1,189 @@
-financial_rates = {
-            "FOMC Rate (Federal Funds Rate)": {
-                "category": "Monetary Policy",
-                "description": "The target interest rate set by the Federal Open Market Committee (FOMC) at which depository institutions lend reserve balances to other institutions overnight. This is the primary tool of U.S. monetary policy and serves as the benchmark for all other interest rates in the economy.",
-                "typical_range": "0% - 6%",
-                "controlled_by": "Federal Reserve FOMC",
-                "frequency": "8 meetings per year",
-                "impact": "Influences all other rates, economic growth, inflation, and employment",
-                "current_use": "Primary monetary policy tool"
-            },
-            "SOFR (Secured Overnight Financing Rate)": {
-                "category": "Reference Rate",
-                "description": "A broad measure of the cost of borrowing cash overnight collateralized by U.S. Treasury securities. SOFR is based on actual transactions in the repo market and has largely replaced LIBOR as the preferred reference rate for financial contracts.",
-                "typical_range": "0% - 5%",
-                "controlled_by": "Market-determined (calculated by NY Fed)",
-                "frequency": "Published daily",
-                "impact": "Benchmark for derivatives, loans, mortgages, and bonds",
-                "current_use": "Primary LIBOR replacement"
-            },
-            "SOFR 30-Day Average": {
-                "category": "Reference Rate",
-                "description": "The arithmetic average of daily SOFR rates over a 30-day period. This smoothed version reduces daily volatility and provides a more stable reference rate for longer-term financial products and contracts.",
-                "typical_range": "0% - 5%",
-                "controlled_by": "Calculated from daily SOFR",
-                "frequency": "Published daily",
-                "impact": "Used for medium-term loans and financial products",
-                "current_use": "Reduces volatility in pricing"
-            },
-            "SOFR 90-Day Average": {
-                "category": "Reference Rate",
-                "description": "The arithmetic average of daily SOFR rates over a 90-day period. This provides an even more stable reference rate for quarterly or longer-term financial contracts, further smoothing out short-term market fluctuations.",
-                "typical_range": "0% - 5%",
-                "controlled_by": "Calculated from daily SOFR",
-                "frequency": "Published daily",
-                "impact": "Used for longer-term loans and financial products",
-                "current_use": "Quarterly contract benchmark"
-            },
-            "SOFR Adjusted": {
-                "category": "Reference Rate",
-                "description": "A version of SOFR that includes a spread adjustment to make it more comparable to USD LIBOR. This adjustment helps ensure continuity in financial contracts transitioning from LIBOR to SOFR.",
-                "typical_range": "0.1% - 5.1%",
-                "controlled_by": "SOFR plus fixed spread adjustment",
-                "frequency": "Published daily",
-                "impact": "Facilitates LIBOR transition",
-                "current_use": "LIBOR replacement with adjustment"
-            },
-            "LIBOR (London Interbank Offered Rate)": {
-                "category": "Legacy Reference Rate",
-                "description": "The benchmark interest rate at which major global banks lend to one another in the international interbank market. LIBOR has been largely phased out due to manipulation scandals and lack of underlying transactions.",
-                "typical_range": "0% - 6% (historical)",
-                "controlled_by": "Previously by panel banks (now discontinued)",
-                "frequency": "Was published daily (now legacy)",
-                "impact": "Historical benchmark (being replaced by SOFR)",
-                "current_use": "Legacy contracts only"
-            },
-            "OIS (Overnight Index Swap)": {
-                "category": "Derivative Rate",
-                "description": "Interest rate swaps where the floating leg is tied to a published overnight rate index. In the U.S., this is typically based on the effective federal funds rate. OIS rates reflect market expectations of future Fed policy.",
-                "typical_range": "0% - 6%",
-                "controlled_by": "Market-determined through trading",
-                "frequency": "Continuous trading",
-                "impact": "Reflects Fed policy expectations",
-                "current_use": "Policy expectation gauge"
-            },
-            "Fannie Mae Rates": {
-                "category": "Mortgage Finance",
-                "description": "Interest rates associated with the Federal National Mortgage Association (Fannie Mae), a government-sponsored enterprise that buys mortgages from lenders. These rates influence conventional mortgage pricing across the United States.",
-                "typical_range": "2% - 8%",
-                "controlled_by": "Market-determined with GSE influence",
-                "frequency": "Daily updates",
-                "impact": "Affects conventional mortgage rates nationwide",
-                "current_use": "Mortgage market benchmark"
-            },
-            "Prime Rate": {
-                "category": "Commercial Banking",
-                "description": "The interest rate that commercial banks charge their most creditworthy customers, typically large corporations with excellent credit ratings. The prime rate is usually set at approximately 3 percentage points above the federal funds rate.",
-                "typical_range": "3% - 9%",
-                "controlled_by": "Individual banks (market convention)",
-                "frequency": "Changes with Fed funds rate",
-                "impact": "Affects business loans, credit cards, and consumer loans",
-                "current_use": "Commercial lending benchmark"
-            },
-            "Discount Rate": {
-                "category": "Monetary Policy",
-                "description": "The interest rate charged by Federal Reserve Banks to commercial banks and other depository institutions on short-term loans through the Fed's discount window. It's typically set above the federal funds rate to encourage interbank lending first.",
-                "typical_range": "0.25% - 6.25%",
-                "controlled_by": "Federal Reserve Banks",
-                "frequency": "As needed by Fed",
-                "impact": "Emergency liquidity for banks",
-                "current_use": "Banking system safety net"
-            },
-            "10-Year Treasury Yield": {
-                "category": "Government Securities",
-                "description": "The return on investment for 10-year U.S. Treasury notes, considered the benchmark for long-term interest rates. It reflects investor expectations about economic growth, inflation, and overall market risk over the next decade.",
-                "typical_range": "1% - 8%",
-                "controlled_by": "Market forces (auctions and trading)",
-                "frequency": "Continuous trading",
-                "impact": "Influences mortgage rates, bond yields, and equity valuations",
-                "current_use": "Long-term rate benchmark"
-            },
-            "30-Year Fixed Mortgage Rate": {
-                "category": "Consumer Finance",
-                "description": "The interest rate charged on a conventional 30-year fixed-rate mortgage loan. This rate is influenced by the 10-year Treasury yield, MBS spreads, and lender profit margins, and represents the most common home financing option in the U.S.",
-                "typical_range": "3% - 8%",
-                "controlled_by": "Market forces and lender pricing",
-                "frequency": "Daily rate updates",
-                "impact": "Affects home affordability and real estate markets",
-                "current_use": "Primary home financing rate"
-            },
-            "FHLB (Federal Home Loan Bank)": {
-                "category": "Government Sponsored Enterprise",
-                "description": "A system of regional banks that provide liquidity to financial institutions for mortgage lending and community development. FHLB rates influence the cost of funds for member banks and affect mortgage market pricing.",
-                "typical_range": "Varies by term and market conditions",
-                "controlled_by": "FHLB System Board",
-                "frequency": "Regular updates based on market conditions",
-                "impact": "Affects mortgage lending costs for member institutions",
-                "current_use": "Wholesale funding for banks"
-            },
-            "COFI (Cost of Funds Index)": {
-                "category": "Regional Index",
-                "description": "A weighted average of interest rates paid by savings institutions on savings and checking accounts, NOW accounts, and certificates of deposit. Used primarily for adjustable-rate mortgages in certain regions.",
-                "typical_range": "1% - 5%",
-                "controlled_by": "Calculated by Federal Home Loan Bank",
-                "frequency": "Monthly calculation",
-                "impact": "Determines rate adjustments for ARM mortgages",
-                "current_use": "ARM benchmark in specific regions"
-            },
-            "FRED (Federal Reserve Economic Data)": {
-                "category": "Data Source",
-                "description": "A comprehensive database maintained by the Federal Reserve Bank of St. Louis containing hundreds of thousands of economic time series from various sources. FRED is the primary source for accessing historical and current economic data.",
-                "typical_range": "N/A (data source)",
-                "controlled_by": "Federal Reserve Bank of St. Louis",
-                "frequency": "Continuous updates",
-                "impact": "Provides data for economic analysis and policy decisions",
-                "current_use": "Primary economic data repository"
-            }
-        }
-quick_terms = {
-    "SOFR": "Secured Overnight Financing Rate - Replaces LIBOR",
-    "FRED": "Federal Reserve Economic Data - Economic data repository",
-    "FHLB": "Federal Home Loan Bank - Federal loan bank",
-    "COFI": "Cost of Funds Index - Funding cost index",
-    "Treasury": "U.S. Treasury Bonds - Government securities",
-    "Prime Rate": "Prime rate offered to top clients"
-}
+import functools
+import operator
+import re
+import sys
+from dataclasses import dataclass
+from types import MappingProxyType
 
+import orjson
+
+
+@dataclass(slots=True, frozen=True)
+class RateInfo:
+    category: str
+    description: str
+    typical_range: str
+    controlled_by: str
+    frequency: str
+    impact: str
+    current_use: str
+
+    def __post_init__(self):
+        # Short values repeat across rates; share one str object per distinct value
+        for field in _SHARED_FIELDS:
+            object.__setattr__(self, field, sys.intern(getattr(self, field)))
+
+
+_SHARED_FIELDS = ("category", "typical_range", "controlled_by", "frequency")
 
-sections_terms = {
-    "SOFR": "Secured Overnight Financing Rate - Replaces LIBOR",
-    "FRED": "Federal Reserve Economic Data - Economic data repository",
-    "FHLB": "Federal Home Loan Bank - Federal loan bank",
-    "COFI": "Cost of Funds Index - Funding cost index",
-    "Treasury": "U.S. Treasury Bonds - Government securities",
-    "Prime Rate": "Prime rate offered to top clients"
-}
 
+def _build_financial_rates():
+    raw_rates = {
+        "FOMC Rate (Federal Funds Rate)": RateInfo(
+            category="Monetary Policy",
+            description="The target interest rate set by the Federal Open Market Committee (FOMC) at which depository institutions lend reserve balances to other institutions overnight. This is the primary tool of U.S. monetary policy and serves as the benchmark for all other interest rates in the economy.",
+            typical_range="0% - 6%",
+            controlled_by="Federal Reserve FOMC",
+            frequency="8 meetings per year",
+            impact="Influences all other rates, economic growth, inflation, and employment",
+            current_use="Primary monetary policy tool"
+        ),
+        "SOFR (Secured Overnight Financing Rate)": RateInfo(
+            category="Reference Rate",
+            description="A broad measure of the cost of borrowing cash overnight collateralized by U.S. Treasury securities. SOFR is based on actual transactions in the repo market and has largely replaced LIBOR as the preferred reference rate for financial contracts.",
+            typical_range="0% - 5%",
+            controlled_by="Market-determined (calculated by NY Fed)",
+            frequency="Published daily",
+            impact="Benchmark for derivatives, loans, mortgages, and bonds",
+            current_use="Primary LIBOR replacement"
+        ),
+        "SOFR 30-Day Average": RateInfo(
+            category="Reference Rate",
+            description="The arithmetic average of daily SOFR rates over a 30-day period. This smoothed version reduces daily volatility and provides a more stable reference rate for longer-term financial products and contracts.",
+            typical_range="0% - 5%",
+            controlled_by="Calculated from daily SOFR",
+            frequency="Published daily",
+            impact="Used for medium-term loans and financial products",
+            current_use="Reduces volatility in pricing"
+        ),
+        "SOFR 90-Day Average": RateInfo(
+            category="Reference Rate",
+            description="The arithmetic average of daily SOFR rates over a 90-day period. This provides an even more stable reference rate for quarterly or longer-term financial contracts, further smoothing out short-term market fluctuations.",
+            typical_range="0% - 5%",
+            controlled_by="Calculated from daily SOFR",
+            frequency="Published daily",
+            impact="Used for longer-term loans and financial products",
+            current_use="Quarterly contract benchmark"
+        ),
+        "SOFR Adjusted": RateInfo(
+            category="Reference Rate",
+            description="A version of SOFR that includes a spread adjustment to make it more comparable to USD LIBOR. This adjustment helps ensure continuity in financial contracts transitioning from LIBOR to SOFR.",
+            typical_range="0.1% - 5.1%",
+            controlled_by="SOFR plus fixed spread adjustment",
+            frequency="Published daily",
+            impact="Facilitates LIBOR transition",
+            current_use="LIBOR replacement with adjustment"
+        ),
+        "LIBOR (London Interbank Offered Rate)": RateInfo(
+            category="Legacy Reference Rate",
+            description="The benchmark interest rate at which major global banks lend to one another in the international interbank market. LIBOR has been largely phased out due to manipulation scandals and lack of underlying transactions.",
+            typical_range="0% - 6% (historical)",
+            controlled_by="Previously by panel banks (now discontinued)",
+            frequency="Was published daily (now legacy)",
+            impact="Historical benchmark (being replaced by SOFR)",
+            current_use="Legacy contracts only"
+        ),
+        "OIS (Overnight Index Swap)": RateInfo(
+            category="Derivative Rate",
+            description="Interest rate swaps where the floating leg is tied to a published overnight rate index. In the U.S., this is typically based on the effective federal funds rate. OIS rates reflect market expectations of future Fed policy.",
+            typical_range="0% - 6%",
+            controlled_by="Market-determined through trading",
+            frequency="Continuous trading",
+            impact="Reflects Fed policy expectations",
+            current_use="Policy expectation gauge"
+        ),
+        "Fannie Mae Rates": RateInfo(
+            category="Mortgage Finance",
+            description="Interest rates associated with the Federal National Mortgage Association (Fannie Mae), a government-sponsored enterprise that buys mortgages from lenders. These rates influence conventional mortgage pricing across the United States.",
+            typical_range="2% - 8%",
+            controlled_by="Market-determined with GSE influence",
+            frequency="Daily updates",
+            impact="Affects conventional mortgage rates nationwide",
+            current_use="Mortgage market benchmark"
+        ),
+        "Prime Rate": RateInfo(
+            category="Commercial Banking",
+            description="The interest rate that commercial banks charge their most creditworthy customers, typically large corporations with excellent credit ratings. The prime rate is usually set at approximately 3 percentage points above the federal funds rate.",
+            typical_range="3% - 9%",
+            controlled_by="Individual banks (market convention)",
+            frequency="Changes with Fed funds rate",
+            impact="Affects business loans, credit cards, and consumer loans",
+            current_use="Commercial lending benchmark"
+        ),
+        "Discount Rate": RateInfo(
+            category="Monetary Policy",
+            description="The interest rate charged by Federal Reserve Banks to commercial banks and other depository institutions on short-term loans through the Fed's discount window. It's typically set above the federal funds rate to encourage interbank lending first.",
+            typical_range="0.25% - 6.25%",
+            controlled_by="Federal Reserve Banks",
+            frequency="As needed by Fed",
+            impact="Emergency liquidity for banks",
+            current_use="Banking system safety net"
+        ),
+        "10-Year Treasury Yield": RateInfo(
+            category="Government Securities",
+            description="The return on investment for 10-year U.S. Treasury notes, considered the benchmark for long-term interest rates. It reflects investor expectations about economic growth, inflation, and overall market risk over the next decade.",
+            typical_range="1% - 8%",
+            controlled_by="Market forces (auctions and trading)",
+            frequency="Continuous trading",
+            impact="Influences mortgage rates, bond yields, and equity valuations",
+            current_use="Long-term rate benchmark"
+        ),
+        "30-Year Fixed Mortgage Rate": RateInfo(
+            category="Consumer Finance",
+            description="The interest rate charged on a conventional 30-year fixed-rate mortgage loan. This rate is influenced by the 10-year Treasury yield, MBS spreads, and lender profit margins, and represents the most common home financing option in the U.S.",
+            typical_range="3% - 8%",
+            controlled_by="Market forces and lender pricing",
+            frequency="Daily rate updates",
+            impact="Affects home affordability and real estate markets",
+            current_use="Primary home financing rate"
+        ),
+        "FHLB (Federal Home Loan Bank)": RateInfo(
+            category="Government Sponsored Enterprise",
+            description="A system of regional banks that provide liquidity to financial institutions for mortgage lending and community development. FHLB rates influence the cost of funds for member banks and affect mortgage market pricing.",
+            typical_range="Varies by term and market conditions",
+            controlled_by="FHLB System Board",
+            frequency="Regular updates based on market conditions",
+            impact="Affects mortgage lending costs for member institutions",
+            current_use="Wholesale funding for banks"
+        ),
+        "COFI (Cost of Funds Index)": RateInfo(
+            category="Regional Index",
+            description="A weighted average of interest rates paid by savings institutions on savings and checking accounts, NOW accounts, and certificates of deposit. Used primarily for adjustable-rate mortgages in certain regions.",
+            typical_range="1% - 5%",
+            controlled_by="Calculated by Federal Home Loan Bank",
+            frequency="Monthly calculation",
+            impact="Determines rate adjustments for ARM mortgages",
+            current_use="ARM benchmark in specific regions"
+        ),
+        "FRED (Federal Reserve Economic Data)": RateInfo(
+            category="Data Source",
+            description="A comprehensive database maintained by the Federal Reserve Bank of St. Louis containing hundreds of thousands of economic time series from various sources. FRED is the primary source for accessing historical and current economic data.",
+            typical_range="N/A (data source)",
+            controlled_by="Federal Reserve Bank of St. Louis",
+            frequency="Continuous updates",
+            impact="Provides data for economic analysis and policy decisions",
+            current_use="Primary economic data repository"
+        )
+    }
+    return MappingProxyType({sys.intern(name): info for name, info in raw_rates.items()})
 
-style = """
+
+QUICK_TERM_PAIRS = (
+    ("SOFR", "Secured Overnight Financing Rate - Replaces LIBOR"),
+    ("FRED", "Federal Reserve Economic Data - Economic data repository"),
+    ("FHLB", "Federal Home Loan Bank - Federal loan bank"),
+    ("COFI", "Cost of Funds Index - Funding cost index"),
+    ("Treasury", "U.S. Treasury Bonds - Government securities"),
+    ("Prime Rate", "Prime rate offered to top clients"),
+)
+
+quick_terms = dict(QUICK_TERM_PAIRS)
+
+
+sections_terms = MappingProxyType(quick_terms)
+
+
+_RAW_STYLE = """
         <style>
             .glossary-header {
                 text-align: center;
@@ -230,7 +258,7 @@ style = """
         </style>
         """
 
-introduction = """
+_RAW_INTRODUCTION = """
 <div style="background-color: #e3f2fd; padding: 1.5rem; border-radius: 10px; margin-bottom: 2rem;">
     <h3 style="color: #1976d2; margin-bottom: 1rem;">🏦 Understanding U.S. Financial Rates</h3>
     <p style="color: #333; line-height: 1.6; margin-bottom: 0;">
@@ -242,29 +270,70 @@ introduction = """
 """
 
 
-def generate_rate_card(rate_name, rate_info):
-    card = f"""
-        <div class="rate-card">
-            <div class="category-badge">{rate_info['category']}</div>
-            <div class="rate-title">{rate_name}</div>
-            <div class="rate-description">{rate_info['description']}</div>
-            <div class="rate-details">
-                <div class="detail-item">
-                    <span class="detail-label">Typical Range:</span> {rate_info['typical_range']}
-                </div>
-                <div class="detail-item">
-                    <span class="detail-label">Controlled By:</span> {rate_info['controlled_by']}
-                </div>
-                <div class="detail-item">
-                    <span class="detail-label">Update Frequency:</span> {rate_info['frequency']}
-                </div>
-                <div class="detail-item">
-                    <span class="detail-label">Economic Impact:</span> {rate_info['impact']}
-                </div>
-                <div class="detail-item">
-                    <span class="detail-label">Current Use:</span> {rate_info['current_use']}
-                </div>
-            </div>
-        </div>
-    """
-    return card
+_WS = re.compile(r"\s+")
+_BETWEEN_TAGS = re.compile(r">\s+<")
+_CSS_DELIMS = re.compile(r"\s*([{}:;,])\s*")
+
+def _build_style():
+    minified = _CSS_DELIMS.sub(r"\1", _BETWEEN_TAGS.sub("><", _RAW_STYLE)).strip()
+    return _WS.sub(" ", minified)
+
+
+def _build_introduction():
+    return _WS.sub(" ", _BETWEEN_TAGS.sub("><", _RAW_INTRODUCTION)).strip()
+
+
+_CARD_FMT = (
+    '<div class="rate-card"><div class="category-badge">%s</div>'
+    '<div class="rate-title">%s</div>'
+    '<div class="rate-description">%s</div>'
+    '<div class="rate-details">'
+    '<div class="detail-item"><span class="detail-label">Typical Range:</span> %s</div>'
+    '<div class="detail-item"><span class="detail-label">Controlled By:</span> %s</div>'
+    '<div class="detail-item"><span class="detail-label">Update Frequency:</span> %s</div>'
+    '<div class="detail-item"><span class="detail-label">Economic Impact:</span> %s</div>'
+    '<div class="detail-item"><span class="detail-label">Current Use:</span> %s</div>'
+    '</div></div>'
+)
+_CARD_FIELDS = operator.attrgetter(
+    "category", "description", "typical_range", "controlled_by", "frequency", "impact", "current_use"
+)
+
+
+@functools.lru_cache(maxsize=None)
+def generate_rate_card(rate_name):
+    cat, desc, tr, cb, fr, im, cu = _CARD_FIELDS(_get("financial_rates")[rate_name])
+    return _CARD_FMT % (cat, rate_name, desc, tr, cb, fr, im, cu)
+
+
+def get_rate_card(rate_name):
+    return _get("RATE_CARDS")[rate_name]
+
+
+# Large constants are built on first access (PEP 562) and then cached as module globals
+_LAZY_BUILDERS = {
+    "financial_rates": _build_financial_rates,
+    "style": _build_style,
+    "introduction": _build_introduction,
+    "RATE_CARDS": lambda: {name: generate_rate_card(name) for name in _get("financial_rates")},
+    # Pre-serialized export payload, served as bytes without re-encoding
+    "FINANCIAL_RATES_JSON": lambda: orjson.dumps(dict(_get("financial_rates")), option=orjson.OPT_INDENT_2),
+}
+
+
+def __getattr__(name):
+    builder = _LAZY_BUILDERS.get(name)
+    if builder is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = builder()
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_BUILDERS))
+
+
+def _get(name):
+    value = globals().get(name)
+    return value if value is not None else __getattr__(name)
@@ -4,22 +4,55 @@ Updated to include authentication and user management with Guest access
 """
 
 import streamlit as st
+import functools
 import os
 from dotenv import load_dotenv
-from typing import Optional, List
+from typing import Tuple
 
-from data_service.data_processor import DataProcessor
-from views.ui_components import (
-    UIComponentFactory, NavigationUI, AppStateManager,
-    FredRatesUI, CustomRateBuilderUI, FHLBRatesUI, FarmerMacRatesUI
-)
-from auth.auth_manager import AuthenticationManager, UserPermissionManager, SessionStateManager
+from views.ui_components import get_ui_factory, NavigationUI
+from auth.auth_manager import get_auth_manager, UserPermissionManager, SessionStateManager
 from views.auth_ui import AuthUI 
 from views.glossary import render_sidebar_glossary, render_full_glossary
 from lib.logger_setup import setup_logging
 import traceback
 
 
+_GUEST_SECTIONS = (
+    "FRED Rates (Limited View)",
+    "FHLB Rates (Limited View)",
+    "📚 Financial Glossary"
+)
+_AUTH_BASE_SECTIONS = (
+    "FRED Rates",
+    "FHLB Rates",
+    "Farmer Mac Rates",
+    "📚 Financial Glossary"
+)
+# Section -> DataProcessor loader worth warming before the section is opened
+_SECTION_PREFETCH = {
+    "FRED Rates (Limited View)": 'load_fred_summary',
+    "FHLB Rates (Limited View)": 'load_fhlb_data',
+    "FRED Rates": 'load_fred_summary',
+    "FHLB Rates": 'load_fhlb_data',
+    "Farmer Mac Rates": 'load_farm_mac_data'
+}
+# Section -> (required permission, message shown when it is missing)
+_SECTION_PERMISSIONS = {
+    "Custom Rate Builder": ('create_custom_rates', "You don't have permission to access the Custom Rate Builder."),
+    "📊 Admin Dashboard": ('manage_users', "You don't have admin permissions.")
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _load_env() -> dict:
+    """Read .env once per process instead of on every controller construction"""
+    load_dotenv()
+    return {
+        'fred_api_key': os.getenv("FRED_API_KEY"),
+        'fred_base_url': os.getenv("FRED_BASE_URL") or "https://api.stlouisfed.org/fred"
+    }
+
+
 class AuthenticatedBankingRatesController:
     """Main application controller with authentication and guest access"""
     
@@ -27,7 +60,7 @@ class AuthenticatedBankingRatesController:
         self.logger = self._setup_logging()
         self.config = self._load_configuration()
         
-        self.auth_manager = AuthenticationManager(allow_guest=True)
+        self.auth_manager = get_auth_manager(allow_guest=True)
         self.permission_manager = UserPermissionManager(self.auth_manager.config)
         
         self.auth_ui = AuthUI(self.auth_manager, self.permission_manager)
@@ -38,6 +71,20 @@ class AuthenticatedBankingRatesController:
         self.data_processor = None
         self.ui_factory = None
         
+        self._section_handlers = {
+            "FRED Rates": self._handle_fred_rates,
+            "Custom Rate Builder": self._handle_custom_rate_builder,
+            "FHLB Rates": self._handle_fhlb_rates,
+            "Farmer Mac Rates": self._handle_farmer_mac_rates,
+            "📚 Financial Glossary": self._handle_glossary,
+            "📊 Admin Dashboard": self._handle_admin_dashboard
+        }
+        self._guest_section_handlers = {
+            "FRED Rates (Limited View)": self._handle_guest_fred_rates,
+            "FHLB Rates (Limited View)": self._handle_guest_fhlb_rates,
+            "📚 Financial Glossary": self._handle_glossary
+        }
+        
         self.logger.info("Authenticated Banking Rates Application initialized with guest access")
     
     def _setup_logging(self):
@@ -85,27 +132,25 @@ class AuthenticatedBankingRatesController:
             st.session_state.error_count = 0
     
     def _load_configuration(self) -> dict:
-        load_dotenv()
-        
-        config = {
-            'fred_api_key': os.getenv("FRED_API_KEY"),
-            'fred_base_url': os.getenv("FRED_BASE_URL")
-        }
+        config = dict(_load_env())
         
         if not config['fred_api_key']:
             self.logger.warning("FRED_API_KEY not found - some features may be limited")
-        if not config['fred_base_url']:
-            config['fred_base_url'] = "https://api.stlouisfed.org/fred"
         
         return config
     
-    def _initialize_data_components(self):
+    def _initialize_data_components(self, sections: Tuple[str, ...]):
         if not self.data_processor:
-            self.data_processor = DataProcessor(
-                fred_api_key=self.config['fred_api_key'],
-                fred_base_url=self.config['fred_base_url']
-            )
-            self.ui_factory = UIComponentFactory(self.data_processor)
+            # Shared per process: the factory and processor hold no per-session state
+            self.ui_factory = get_ui_factory(self.config['fred_api_key'], self.config['fred_base_url'])
+            self.data_processor = self.ui_factory.data_processor
+        
+        # Warm only what this user can open, once per session, without holding up the render
+        prefetched = st.session_state.get('_data_prefetched', frozenset())
+        pending = {_SECTION_PREFETCH[s] for s in sections if s in _SECTION_PREFETCH} - prefetched
+        if pending:
+            self.data_processor.prefetch(sorted(pending))
+            st.session_state._data_prefetched = prefetched | pending
     
     def run(self):
         try:
@@ -114,7 +159,7 @@ class AuthenticatedBankingRatesController:
             self._handle_authentication()
             
         except Exception as e:
-            self.logger.error(f"Application error: {str(e)}")
+            self.logger.error("Application error: %s", e)
             st.error("An error occurred while running the application.")
             
             if self.auth_manager.is_authenticated():
@@ -180,7 +225,7 @@ class AuthenticatedBankingRatesController:
     
     def _handle_guest_user(self):
         self.auth_manager.process_login()
-        self._initialize_data_components()
+        self._initialize_data_components(self._get_guest_sections())
         self.auth_manager.render_user_info_sidebar()
         st.info("🚶 **Browsing as guest** - Limited functionality available")
         
@@ -199,7 +244,7 @@ class AuthenticatedBankingRatesController:
     
     def _handle_authenticated_user(self):
         self.auth_manager.process_login()
-        self._initialize_data_components()
+        self._initialize_data_components(self._get_available_sections(self.auth_manager.get_current_user()))
         self.auth_manager.render_user_info_sidebar()
         self._render_authenticated_content()
         
@@ -227,43 +272,39 @@ class AuthenticatedBankingRatesController:
         self._route_to_section(selected_section)
         NavigationUI.render_footer()
     
-    def _get_guest_sections(self) -> List[str]:
-        return [
-            "FRED Rates (Limited View)",
-            "FHLB Rates (Limited View)", 
-            "📚 Financial Glossary"
-        ]
+    def _get_guest_sections(self) -> Tuple[str, ...]:
+        return _GUEST_SECTIONS
     
-    def _get_available_sections(self, username: str) -> List[str]:
-        base_sections = [
-            "FRED Rates",
-            "FHLB Rates", 
-            "Farmer Mac Rates",
-            "📚 Financial Glossary"
-        ]
-        
-        if self.permission_manager.has_permission(username, 'create_custom_rates'):
-            base_sections.insert(1, "Custom Rate Builder")
-        
-        if self.permission_manager.has_permission(username, 'manage_users'):
-            base_sections.append("📊 Admin Dashboard")
+    def _get_available_sections(self, username: str) -> Tuple[str, ...]:
+        # Permissions do not change within a login, so reuse the list across reruns
+        cached = st.session_state.get('_sections_cache')
+        if cached and cached[0] == username:
+            return cached[1]
+        
+        can_build = self.permission_manager.has_permission(username, 'create_custom_rates')
+        is_admin = self.permission_manager.has_permission(username, 'manage_users')
+        
+        if can_build or is_admin:
+            base_sections = list(_AUTH_BASE_SECTIONS)
+            if can_build:
+                base_sections.insert(1, "Custom Rate Builder")
+            if is_admin:
+                base_sections.append("📊 Admin Dashboard")
+            sections = tuple(base_sections)
+        else:
+            sections = _AUTH_BASE_SECTIONS
         
-        return base_sections
+        st.session_state._sections_cache = (username, sections)
+        return sections
     
     def _route_to_guest_section(self, section: str):
-        guest_handlers = {
-            "FRED Rates (Limited View)": self._handle_guest_fred_rates,
-            "FHLB Rates (Limited View)": self._handle_guest_fhlb_rates,
-            "📚 Financial Glossary": self._handle_glossary
-        }
-        
-        handler = guest_handlers.get(section)
+        handler = self._guest_section_handlers.get(section)
         if handler:
             try:
                 handler()
             except Exception as e:
                 traceback.print_exc()
-                self.logger.error(f"Error in guest section '{section}': {str(e)}")
+                self.logger.error("Error in guest section '%s': %s", section, e)
                 st.error(f"An error occurred while loading the {section} section.")
         else:
             st.error(f"Unknown section: {section}")
@@ -271,31 +312,19 @@ class AuthenticatedBankingRatesController:
     def _route_to_section(self, section: str):
         username = self.auth_manager.get_current_user()
         
-        section_handlers = {
-            "FRED Rates": self._handle_fred_rates,
-            "Custom Rate Builder": self._handle_custom_rate_builder,
-            "FHLB Rates": self._handle_fhlb_rates,
-            "Farmer Mac Rates": self._handle_farmer_mac_rates,
-            "📚 Financial Glossary": self._handle_glossary,
-            "📊 Admin Dashboard": self._handle_admin_dashboard
-        }
-        
-        handler = section_handlers.get(section)
+        handler = self._section_handlers.get(section)
         if handler:
             try:
-                if section == "Custom Rate Builder" and not self.permission_manager.has_permission(username, 'create_custom_rates'):
-                    st.warning("You don't have permission to access the Custom Rate Builder.")
-                    return
-                
-                if section == "📊 Admin Dashboard" and not self.permission_manager.has_permission(username, 'manage_users'):
-                    st.warning("You don't have admin permissions.")
+                required = _SECTION_PERMISSIONS.get(section)
+                if required and not self.permission_manager.has_permission(username, required[0]):
+                    st.warning(required[1])
                     return
                 
                 handler()
                 
             except Exception as e:
                 traceback.print_exc()
-                self.logger.error(f"Error in section '{section}': {str(e)}")
+                self.logger.error("Error in section '%s': %s", section, e)
                 st.error(f"An error occurred while loading the {section} section.")
         else:
             st.error(f"Unknown section: {section}")
@@ -306,22 +335,12 @@ class AuthenticatedBankingRatesController:
         st.subheader("📊 FRED Rates - Limited View")
         st.info("🚶 **Guest Mode:** Basic visualization available. Register for full features.")
         
-        fred_ui = self.ui_factory.create_fred_rates_ui()
-        original_render = fred_ui.render
-        
-        def guest_render():
-            original_render()
-            st.warning("⚠️ **Guest Limitations:**")
-            st.markdown("""
+        self.ui_factory.create_fred_rates_ui().render()
+        self._render_guest_upgrade_prompt('fred', """
             - Data download is not available
             - Limited view of time series
             - Cannot customize advanced parameters
             """)
-            if st.button("🔐 Upgrade for full access"):
-                st.info("Contact the administrator to get a full account")
-        
-        fred_ui.render = guest_render
-        fred_ui.render()
     
     def _handle_guest_fhlb_rates(self):
         self.logger.info("Rendering FHLB rates section for guest")
@@ -329,22 +348,18 @@ class AuthenticatedBankingRatesController:
         st.subheader("🏦 FHLB Rates - Limited View")
         st.info("🚶 **Guest Mode:** Basic visualization available. Register for full features.")
         
-        fhlb_ui = self.ui_factory.create_fhlb_rates_ui()
-        original_render = fhlb_ui.render
-        
-        def guest_render():
-            original_render()
-            st.warning("⚠️ **Guest Limitations:**")
-            st.markdown("""
+        self.ui_factory.create_fhlb_rates_ui().render()
+        self._render_guest_upgrade_prompt('fhlb', """
             - Data download is not available
             - Limited view of historical rates
             - Cannot generate custom reports
             """)
-            if st.button("🔐 Upgrade for full access", key="fhlb_upgrade"):
-                st.info("Contact the administrator to get a full account")
-        
-        fhlb_ui.render = guest_render
-        fhlb_ui.render()
+    
+    def _render_guest_upgrade_prompt(self, key_suffix: str, limitations: str):
+        st.warning("⚠️ **Guest Limitations:**")
+        st.markdown(limitations)
+        if st.button("🔐 Upgrade for full access", key=f"{key_suffix}_upgrade"):
+            st.info("Contact the administrator to get a full account")
     
     def _handle_fred_rates(self):
         self.logger.info("Rendering FRED rates section")
@@ -391,7 +406,7 @@ class AuthenticatedBankingRatesController:
             self.auth_ui.render_permissions()
             
         except Exception as e:
-            self.logger.error(f"Error rendering admin dashboard: {str(e)}")
+            self.logger.error("Error rendering admin dashboard: %s", e)
             st.error("An error occurred while loading the admin dashboard.")
             st.subheader("📊 Basic Admin Dashboard")
             st.info("Advanced features are temporarily unavailable. Showing basic admin info.")
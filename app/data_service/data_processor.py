@@ -4,90 +4,129 @@ Data processing module for Banking Rates Dashboard
 Handles all data fetching, transformation, and caching operations
 """
 
+import functools
+import logging
+import numpy as np
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Iterable, List, Tuple, Optional
 import streamlit as st
 
-from constants.fred import FRED_SERIES_REGISTRY
+from constants.fred import FRED_NAMES, FRED_SERIES_IDS, FRED_SOURCES, NAME_TO_SERIES_ID
 from data_service.fetchers.fetch_rates import FredSeries
 from data_service.scrapers.fhlb_scraper import FHLBScraper
 from data_service.scrapers.farmer_mac import FarmerMacScraper
 
+logger = logging.getLogger(__name__)
+
+# Long-lived so prefetches outlive the run that queued them; a section needing the data
+# mid-fetch waits on the cache's per-key lock rather than fetching again
+_PREFETCH_EXECUTOR = ThreadPoolExecutor(max_workers=3, thread_name_prefix="prefetch")
+
+FRED_FETCH_WORKERS = 8
+OPERATION_SYMBOLS = {"Add": "+", "Subtract": "-", "Multiply": "*", "Divide": "/"}
+OPERATION_UFUNCS = {"Add": np.add, "Subtract": np.subtract, "Multiply": np.multiply, "Divide": np.divide}
+COFI_YEARLY_TERMS = ['1-Year COFI', '5-Year Reset', '10-Year Reset', '15-Year Reset']
+
+
+def _log_prefetch_failure(name: str, future) -> None:
+    """Log a failed prefetch; the section that needs the data retries it on demand"""
+    if future.exception() is not None:
+        logger.warning("Prefetch of %s failed: %s", name, future.exception())
+
+
+# Shared per process so the HTTP session and its connection pool survive reruns
+@st.cache_resource
+def _get_fred_series(api_key: str, url: str) -> FredSeries:
+    return FredSeries(api_key, url)
+
+
+@st.cache_resource
+def _get_fhlb_scraper(wait_time: int = 1) -> FHLBScraper:
+    return FHLBScraper(wait_time=wait_time)
+
+
+@st.cache_resource
+def _get_farm_mac_scraper(wait_time: int = 1) -> FarmerMacScraper:
+    return FarmerMacScraper(wait_time=wait_time)
+
 
 class DataProcessor:
     """Main data processing class for banking rates"""
     
     def __init__(self, fred_api_key: str, fred_base_url: str):
-        self.fred_series = FredSeries(fred_api_key, fred_base_url)
-        self.fhlb_scraper = FHLBScraper(wait_time=1)
-        self.farm_mac_scraper = FarmerMacScraper(wait_time=1)
+        self.fred_series = _get_fred_series(fred_api_key, fred_base_url)
+        self.fhlb_scraper = _get_fhlb_scraper(wait_time=1)
+        self.farm_mac_scraper = _get_farm_mac_scraper(wait_time=1)
+    
+    def _fetch_latest(self, series_id: str) -> Tuple[str, object]:
+        """Fetch one FRED series and return its latest date and value"""
+        df = self.fred_series.run_pipeline(series_id)
+        
+        if not df.empty:
+            latest = df.index.max()
+            return latest.strftime('%Y-%m-%d'), round(df.loc[latest, 'value'], 2)
+        return 'N/A', 'No Data'
     
-    @st.cache_data
+    # Same hourly refresh as the scraped sources; the fetch timestamp travels inside the cached value
+    @st.cache_data(ttl=3600, show_spinner=False)
     def load_fred_summary(_self) -> Tuple[pd.DataFrame, str]:
         """Load and cache FRED summary data"""
-        records = []
-        for name, meta in FRED_SERIES_REGISTRY.items():
-            df = _self.fred_series.run_pipeline(meta['series_id'])
-            source_url = meta['source']
-            
-            if not df.empty:
-                latest = df.index.max()
-                val = df.loc[latest, 'value']
-                records.append({
-                    'Rate Name': name,
-                    'Latest Date': latest.strftime('%Y-%m-%d'),
-                    'Latest Value': round(val, 2),
-                    'Source': source_url
-                })
-            else:
-                records.append({
-                    'Rate Name': name,
-                    'Latest Date': 'N/A',
-                    'Latest Value': 'No Data',
-                    'Source': source_url
-                })
+        # Series fetches are independent HTTP calls, so overlap them
+        with ThreadPoolExecutor(max_workers=FRED_FETCH_WORKERS) as executor:
+            latest = list(executor.map(_self._fetch_latest, FRED_SERIES_IDS))
         
-        return pd.DataFrame(records), datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        summary = pd.DataFrame({
+            'Rate Name': list(FRED_NAMES),
+            'Latest Date': [date for date, _ in latest],
+            'Latest Value': [value for _, value in latest],
+            'Source': list(FRED_SOURCES)
+        })
+        return summary, datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    
+    def prefetch(self, loader_names: Iterable[str]) -> None:
+        """Start warming the named loader caches in the background without waiting on them"""
+        for name in loader_names:
+            future = _PREFETCH_EXECUTOR.submit(getattr(self, name))
+            future.add_done_callback(functools.partial(_log_prefetch_failure, name))
     
     def get_combined_rate_summary(self) -> Tuple[pd.DataFrame, str]:
         """Get combined summary including custom rates"""
-        records = []
-        
         # Start with cached base summary
         fred_df, fetch_time = self.load_fred_summary()
-        records.extend(fred_df.to_dict("records"))
         
         # Add custom rates from session state
-        if 'custom_rates' in st.session_state:
-            for custom_name, series in st.session_state.custom_rates.items():
-                if not series.empty:
-                    latest = series.index.max()
-                    val = series.loc[latest]
-                    records.append({
-                        'Rate Name': custom_name,
-                        'Latest Date': latest.strftime('%Y-%m-%d'),
-                        'Latest Value': round(val, 2),
-                        'Source': 'User-defined custom rate'
-                    })
-        
-        return pd.DataFrame(records), fetch_time
-    
-    @st.cache_data
+        custom_records = []
+        for custom_name, series in st.session_state.get('custom_rates', {}).items():
+            if not series.empty:
+                latest = series.index.max()
+                val = series.loc[latest]
+                custom_records.append({
+                    'Rate Name': custom_name,
+                    'Latest Date': latest.strftime('%Y-%m-%d'),
+                    'Latest Value': round(val, 2),
+                    'Source': 'User-defined custom rate'
+                })
+        
+        if not custom_records:
+            return fred_df, fetch_time
+        return pd.concat([fred_df, pd.DataFrame(custom_records)], ignore_index=True), fetch_time
+    
+    @st.cache_data(ttl=3600, show_spinner=False)
     def load_fred_series(_self, series_id: str) -> pd.DataFrame:
         """Load specific FRED series data"""
-        df = _self.fred_series.run_pipeline(series_id)
-        if not df.empty:
-            df.index = pd.to_datetime(df.index)
-        return df
+        # run_pipeline already returns a sorted DatetimeIndex
+        return _self.fred_series.run_pipeline(series_id)
     
-    @st.cache_data
+    # Returned objects are shared across sessions; callers must copy before mutating
+    @st.cache_resource(ttl=3600)
     def load_fhlb_data(_self) -> Dict:
         """Load FHLB rates data"""
         rates = _self.fhlb_scraper.run_pipeline()
         return rates
     
-    @st.cache_data
+    @st.cache_resource(ttl=3600)
     def load_farm_mac_data(_self) -> Tuple[Dict, str]:
         """Load Farmer Mac COFI data"""
         df_yearly, df_3_months = _self.farm_mac_scraper.run_pipeline()
@@ -104,53 +143,51 @@ class CustomRateBuilder:
     def __init__(self, data_processor: DataProcessor):
         self.data_processor = data_processor
     
-    def create_simple_custom_rate(self, base_rate: str, operation: str, 
+    # Keyed on the small, hashable rate inputs; the builder itself is not hashed
+    @st.cache_data(ttl=3600, show_spinner=False, max_entries=32)
+    def create_simple_custom_rate(_self, base_rate: str, operation: str, 
                                  custom_value: float) -> Tuple[pd.Series, str]:
         """Create simple custom rate with single operation"""
-        series_id = FRED_SERIES_REGISTRY[base_rate]['series_id']
-        base_df = self.data_processor.fred_series.run_pipeline(series_id)
+        series_id = NAME_TO_SERIES_ID[base_rate]
+        base_df = _self.data_processor.load_fred_series(series_id)
         
         if base_df.empty:
             return pd.Series(), ""
         
-        label_map = {
-            "Add": "+", "Subtract": "-", "Multiply": "*", "Divide": "/"
-        }
-        symbol = label_map[operation]
-        rate_name = f"{base_rate} {symbol} {custom_value}"
-        
-        if operation == "Add":
-            custom_series = base_df['value'] + custom_value
-        elif operation == "Subtract":
-            custom_series = base_df['value'] - custom_value
-        elif operation == "Multiply":
-            custom_series = base_df['value'] * custom_value
-        elif operation == "Divide":
-            custom_series = base_df['value'] / custom_value
+        rate_name = f"{base_rate} {OPERATION_SYMBOLS[operation]} {custom_value}"
+        
+        values = base_df['value']
+        # Match pandas arithmetic, which yields inf/NaN on division by zero without warning
+        with np.errstate(divide='ignore', invalid='ignore'):
+            result = OPERATION_UFUNCS[operation](values.to_numpy(), custom_value)
+        custom_series = pd.Series(result, index=values.index, name=values.name)
         
         return custom_series, rate_name
     
-    def create_weighted_custom_rate(self, components: List[Tuple[str, float]]) -> Tuple[pd.Series, str]:
+    @st.cache_data(ttl=3600, show_spinner=False, max_entries=32)
+    def create_weighted_custom_rate(_self, components: List[Tuple[str, float]]) -> Tuple[pd.Series, str]:
         """Create weighted combination of multiple rates"""
         series_data = []
         
         for rate_name, weight in components:
-            series_id = FRED_SERIES_REGISTRY[rate_name]['series_id']
-            df = self.data_processor.fred_series.run_pipeline(series_id)
+            series_id = NAME_TO_SERIES_ID[rate_name]
+            df = _self.data_processor.load_fred_series(series_id)
             if not df.empty:
                 series_data.append((df['value'], weight / 100.0, rate_name))
         
         if not series_data:
             return pd.Series(), ""
         
-        # Use first series as base index
-        base_index = series_data[0][0].index
-        custom_series = pd.Series(0.0, index=base_index)
         label = " + ".join([f"{w*100:.0f}% {name}" for _, w, name in series_data])
         
-        for series, weight, _ in series_data:
-            aligned = series.reindex(base_index).fillna(method='ffill')
-            custom_series += aligned * weight
+        # Align all components on the union of their dates, then combine in one dot product
+        frame = pd.concat([series for series, _, _ in series_data], axis=1)
+        # Date lookups binary-search the result, and ffill needs chronological order anyway
+        if not frame.index.is_monotonic_increasing:
+            frame = frame.sort_index()
+        frame = frame.ffill()
+        weights = np.array([w for _, w, _ in series_data])
+        custom_series = pd.Series(frame.to_numpy() @ weights, index=frame.index)
         
         return custom_series, label
     
@@ -166,45 +203,74 @@ class CustomRateBuilder:
 class DataFilterer:
     """Handles data filtering and date range operations"""
     
+    @staticmethod
+    def _slice_days(df: pd.DataFrame, start_date: pd.Timestamp,
+                    end_date: pd.Timestamp) -> pd.DataFrame:
+        """Slice a date-sorted dataframe or series to whole days from start_date through end_date"""
+        # Callers pass Timestamps, datetimes or dates; coerce before normalizing to whole days
+        index = df.index
+        lo = index.searchsorted(pd.Timestamp(start_date).normalize(), side='left')
+        hi = index.searchsorted(pd.Timestamp(end_date).normalize() + pd.Timedelta(days=1), side='left')
+        return df.iloc[lo:hi]
+    
     @staticmethod
     def filter_by_date(df: pd.DataFrame, target_date: pd.Timestamp) -> pd.DataFrame:
         """Filter dataframe by specific date"""
-        return df.loc[df.index.date == target_date.date()]
+        return DataFilterer._slice_days(df, target_date, target_date)
     
     @staticmethod
     def filter_by_date_range(df: pd.DataFrame, start_date: pd.Timestamp, 
                            end_date: pd.Timestamp) -> pd.DataFrame:
         """Filter dataframe by date range"""
-        return df.loc[(df.index.date >= start_date.date()) & 
-                     (df.index.date <= end_date.date())]
+        return DataFilterer._slice_days(df, start_date, end_date)
     
     @staticmethod
     def get_monthly_data(df: pd.DataFrame) -> pd.DataFrame:
         """Get monthly data (first day of each month)"""
-        return df[df.index.day == 1]
+        return df[df.index.is_month_start]
     
     @staticmethod
+    @st.cache_data(show_spinner=False, max_entries=32)
     def prepare_download_data(df: pd.DataFrame, rate_name: str) -> pd.DataFrame:
         """Prepare data for download with proper formatting"""
         named_df = df.rename(columns={"value": rate_name})
         named_df = named_df.reset_index()
         named_df.columns = ["Date", rate_name]
-        named_df["Date"] = named_df["Date"].dt.strftime("%Y-%m")
+        named_df["Date"] = named_df["Date"].dt.to_period("M").astype(str)
         return named_df
 
 
+def _loess(x: np.ndarray, y: np.ndarray, bandwidth: float) -> np.ndarray:
+    """Local linear fit with tricube weights over the nearest bandwidth*n points (Vega's loess)"""
+    n = len(x)
+    if n < 3:
+        return y.astype(float)
+    k = max(2, int(bandwidth * n))
+    dist = np.abs(x[:, None] - x[None, :])
+    radius = np.maximum(np.partition(dist, k - 1, axis=1)[:, k - 1], np.finfo(float).tiny)
+    weights = np.clip(1 - (dist / radius[:, None]) ** 3, 0, None) ** 3
+    total = weights.sum(axis=1)
+    x_mean = (weights @ x) / total
+    y_mean = (weights @ y) / total
+    dx = x[None, :] - x_mean[:, None]
+    var = (weights * dx * dx).sum(axis=1)
+    cov = (weights * dx * (y[None, :] - y_mean[:, None])).sum(axis=1)
+    slope = np.divide(cov, var, out=np.zeros(n), where=var > 0)
+    return y_mean + slope * (x - x_mean)
+
+
 class CofiDataProcessor:
     """Specialized processor for COFI data transformations"""
     
     @staticmethod
     def process_yearly_cofi(cofi_yearly: pd.DataFrame) -> pd.DataFrame:
         """Process yearly COFI data for visualization"""
-        # Convert percentage strings to numeric values
-        for col in ['1-Year COFI', '5-Year Reset', '10-Year Reset', '15-Year Reset']:
-            cofi_yearly[col] = pd.to_numeric(
-                cofi_yearly[col].astype(str).str.replace('%', '', regex=False),
-                errors='coerce'
-            )
+        # Convert percentage strings to numeric values in one block operation
+        cofi_yearly[COFI_YEARLY_TERMS] = (
+            cofi_yearly[COFI_YEARLY_TERMS].astype(str)
+            .replace('%', '', regex=True)
+            .apply(pd.to_numeric, errors='coerce')
+        )
         
         cofi_yearly = cofi_yearly.reset_index()
         cofi_yearly = cofi_yearly.rename(columns={'index': 'Year'})
@@ -212,7 +278,7 @@ class CofiDataProcessor:
         # Melt for visualization
         df_long = cofi_yearly.melt(
             id_vars='Year',
-            value_vars=['1-Year COFI', '5-Year Reset', '10-Year Reset', '15-Year Reset'],
+            value_vars=COFI_YEARLY_TERMS,
             var_name='Term',
             value_name='Rate'
         )
@@ -220,6 +286,7 @@ class CofiDataProcessor:
         return df_long
     
     @staticmethod
+    @st.cache_data(show_spinner=False, max_entries=8)
     def process_monthly_cofi(cofi_3_months: pd.DataFrame) -> pd.DataFrame:
         """Process monthly COFI data for visualization"""
         cofi_3_months = cofi_3_months.copy()
@@ -229,4 +296,7 @@ class CofiDataProcessor:
             format='%Y-%B'
         )
         cofi_3_months = cofi_3_months.sort_values(by='Date')
+        # Smooth once here instead of running transform_loess in the browser on every render
+        days = (cofi_3_months['Date'] - cofi_3_months['Date'].min()).dt.days.to_numpy(dtype=float)
+        cofi_3_months['COFI_smooth'] = _loess(days, cofi_3_months['COFI'].to_numpy(dtype=float), bandwidth=0.5)
         return cofi_3_months
\ No newline at end of file
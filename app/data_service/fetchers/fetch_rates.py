@@ -2,8 +2,12 @@
 import os
 import logging
 
+from datetime import date
+from pathlib import Path
 from typing import Optional, Dict
 
+import numpy as np
+import orjson
 import pandas as pd
 import requests
 from requests.adapters import HTTPAdapter
@@ -14,6 +18,18 @@ from dotenv import load_dotenv
 load_dotenv()
 g_logger = logging.getLogger(__name__)
 
+# Processed series are kept on disk for the day so container restarts skip the refetch
+FRED_CACHE_DIR = Path(os.getenv("FRED_CACHE_DIR", ".fred_cache"))
+HTTP_POOL_SIZE = 16
+
+
+def _to_float(value: str) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
 class FredSeries:
     def __init__(self, api_key: str, url: str):
         self.api_key = api_key
@@ -25,8 +41,15 @@ class FredSeries:
             status_forcelist=[500, 502, 503, 504],
             allowed_methods=["GET"]
         )
-        self.session.mount('https://', HTTPAdapter(max_retries=_retry_strategy))
-        self.session.mount('http://', HTTPAdapter(max_retries=_retry_strategy))
+        # Sized for the concurrent summary fetch so workers do not wait on a free connection
+        _adapter = HTTPAdapter(
+            max_retries=_retry_strategy,
+            pool_connections=HTTP_POOL_SIZE,
+            pool_maxsize=HTTP_POOL_SIZE
+        )
+        self.session.mount('https://', _adapter)
+        self.session.mount('http://', _adapter)
+        self.session.headers.update({'Connection': 'keep-alive', 'Accept-Encoding': 'gzip'})
 
     def _generate_params(self, start_date: str,series_id:str) -> Dict[str, str]:
         params = {
@@ -50,7 +73,7 @@ class FredSeries:
         try:
             response = self.session.get(url, params=params, timeout=10)
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
         except requests.RequestException as err:
             g_logger.error("Request to %s failed: %s", url, err)
         except ValueError as err:
@@ -66,22 +89,55 @@ class FredSeries:
             )
             return pd.DataFrame()
 
-        df = pd.DataFrame(observations)
-        df['date'] = pd.to_datetime(df['date'], errors='coerce')
-        df['value'] = pd.to_numeric(df['value'], errors='coerce')
-        df = df.set_index('date').sort_index()
+        # Build only the two needed columns as typed arrays; FRED marks missing values with "."
+        count = len(observations)
+        dates = np.fromiter((o['date'] for o in observations), dtype='datetime64[ns]', count=count)
+        values = np.fromiter((_to_float(o['value']) for o in observations), dtype=np.float64, count=count)
+        df = pd.DataFrame({'value': values}, index=pd.DatetimeIndex(dates, name='date'))
 
-        return df[['value']]
+        return df.sort_index()
     
+    def _cache_path(self, series_id: str, start_date: str) -> Path:
+        return FRED_CACHE_DIR / f"{series_id}_{start_date}_{date.today().isoformat()}.pkl"
+
+    def _read_cache(self, path: Path) -> Optional[pd.DataFrame]:
+        try:
+            return pd.read_pickle(path)
+        except FileNotFoundError:
+            return None
+        except Exception as err:
+            g_logger.warning("Ignoring unreadable FRED cache %s: %s", path, err)
+            return None
+
+    def _write_cache(self, path: Path, df: pd.DataFrame) -> None:
+        try:
+            FRED_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            # Drop earlier days for this series before writing today's copy
+            prefix = path.name.rsplit("_", 1)[0]
+            for stale in FRED_CACHE_DIR.glob(f"{prefix}_*.pkl"):
+                stale.unlink(missing_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.{id(df)}.tmp")
+            df.to_pickle(tmp_path)
+            os.replace(tmp_path, path)
+        except OSError as err:
+            g_logger.warning("Could not write FRED cache %s: %s", path, err)
+
     def run_pipeline(self,series_id: str,start_date: str = '2020-01-01') -> pd.DataFrame:
 
         if not self._is_env_valid():
             return pd.DataFrame()
         
+        cache_path = self._cache_path(series_id, start_date)
+        cached = self._read_cache(cache_path)
+        if cached is not None:
+            return cached
+        
         params = self._generate_params(start_date,series_id)
         payload = self._fetch_data(self.source, params)
         processed_data = self._process_data(payload)
-        g_logger.info(f"Data fetched and processed successfully. For series {series_id}")
+        if not processed_data.empty:
+            self._write_cache(cache_path, processed_data)
+        g_logger.info("Data fetched and processed successfully. For series %s", series_id)
         return processed_data
 
 
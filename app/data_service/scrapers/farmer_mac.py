@@ -2,11 +2,16 @@ from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
 from webdriver_manager.chrome import ChromeDriverManager
 from data_service.scrapers.web_driver import WebDriverContext
-from bs4 import BeautifulSoup
+from data_service.scrapers.static_page import fetch_static_html
+from selectolax.lexbor import LexborHTMLParser
 import pandas as pd
-import time
+
+PAGE_LOAD_TIMEOUT = 10
+YEARLY_COLUMNS = ["1-Year COFI", "5-Year Reset", "10-Year Reset", "15-Year Reset"]
 
 class FarmerMacScraper():
     def __init__(self, wait_time=1):
@@ -14,20 +19,27 @@ class FarmerMacScraper():
 
     def get_page(self, driver, url = "https://www.farmermac.com/cofi/"):
         driver.get(url)
-        time.sleep(self.wait_time)
+        # Return as soon as the COFI table is in the DOM instead of sleeping a fixed time
+        WebDriverWait(driver, PAGE_LOAD_TIMEOUT).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, "table tbody tr"))
+        )
         return driver.page_source
     
     def extract_data(self, html):
-        soup = BeautifulSoup(html, "html.parser")
-        headers = [th.get_text(strip=True) for th in soup.find_all('th')]
-        data_rows = []
-        for row in soup.find_all('tbody')[0].find_all('tr'):
-            cols = [td.get_text(strip=True) for td in row.find_all('td')]
-            data_rows.append(dict(zip(headers, cols)))
-        return data_rows
+        tree = LexborHTMLParser(html)
+        body = tree.css_first('tbody')
+        if body is None:
+            return pd.DataFrame()
+        headers = [th.text(strip=True) for th in tree.css('th')]
+        width = len(headers)
+        # Row tuples go straight into one frame; short rows are padded with '' like empty cells
+        rows = [tuple(td.text(strip=True) for td in row.css('td'))[:width] for row in body.css('tr')]
+        return pd.DataFrame(rows, columns=headers).fillna('')
 
     def parse_data(self,data_raw):
         data = self.process_data(data_raw)
+        if data.empty:
+            return {'yearly_resets': pd.DataFrame(), 'monthly_3month_cofi': pd.DataFrame()}
         yearly_resets = self.get_yearly_data(data) 
         monthly_3month_cofi = self.get_monthly_data(data) 
         return {
@@ -36,48 +48,33 @@ class FarmerMacScraper():
         }
 
     def process_data(self,data):
-        current_year = ""
-        for row in data:
-            if row["Year"]:
-                current_year = row["Year"]
-            else:
-                row["Year"] = current_year
+        if data.empty:
+            return data
+        # Only the first month of each year carries the year; carry it down the blank cells
+        data['Year'] = data['Year'].replace('', pd.NA).ffill().fillna('')
         return data
 
     def get_yearly_data(self,data):
-        yearly_resets = {}
-        for row in data:
-            year = row["Year"]
-            if year not in yearly_resets and row["1-Year COFI"]:
-                yearly_resets[year] = {
-                    "1-Year COFI": row["1-Year COFI"],
-                    "5-Year Reset": row["5-Year Reset"],
-                    "10-Year Reset": row["10-Year Reset"],
-                    "15-Year Reset": row["15-Year Reset"]
-                }
-        return yearly_resets
+        # First row per year that has a 1-Year COFI value, indexed by year
+        yearly_resets = data[data["1-Year COFI"] != ""].drop_duplicates("Year")
+        return yearly_resets.set_index("Year")[YEARLY_COLUMNS].rename_axis(None)
 
     def get_monthly_data(self,data):
-        monthly_3month_cofi = []
-        for row in data:
-            if row["3-Month COFI*"]:
-                monthly_3month_cofi.append({
-                    "Year": row["Year"],
-                    "Month": row["Month"],
-                    "3-Month COFI": row["3-Month COFI*"]
-                })
-        return monthly_3month_cofi
+        monthly_3month_cofi = data.loc[data["3-Month COFI*"] != "", ["Year", "Month", "3-Month COFI*"]]
+        return monthly_3month_cofi.rename(columns={"3-Month COFI*": "3-Month COFI"}).reset_index(drop=True)
     
     def generate_dataframes(self, data):
-        df_yearly = pd.DataFrame(data['yearly_resets']).T
-        df_monthly = pd.DataFrame(data['monthly_3month_cofi'])
-        return df_yearly, df_monthly
+        return data['yearly_resets'], data['monthly_3month_cofi']
     
     def run_pipeline(self):
-        with WebDriverContext(headless=True) as driver:
-            url = "https://www.farmermac.com/cofi/"
-            html = self.get_page(driver, url)
-        data_raw = self.extract_data(html)
+        url = "https://www.farmermac.com/cofi/"
+        # The COFI table is usually server-rendered; only start Chrome when it is not
+        html = fetch_static_html(url)
+        data_raw = self.extract_data(html) if html else pd.DataFrame()
+        if data_raw.empty:
+            with WebDriverContext(headless=True) as driver:
+                html = self.get_page(driver, url)
+            data_raw = self.extract_data(html)
         data = self.parse_data(data_raw)
         df_yearly, df_monthly = self.generate_dataframes(data)
         return df_yearly, df_monthly
@@ -1,20 +1,24 @@
 import pandas as pd
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 import re
 from data_service.scrapers.web_driver import WebDriverContext
+from data_service.scrapers.static_page import fetch_static_html
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-import time
 from datetime import datetime
 
+PAGE_LOAD_TIMEOUT = 10
+
 class FHLBScraper:
     def __init__(self, wait_time=1):
         self.wait_time = wait_time
 
     def get_page(self, driver, url):
         driver.get(url)
-        time.sleep(self.wait_time)
+        WebDriverWait(driver, PAGE_LOAD_TIMEOUT).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, "#long-term-fixed .table-daily-rates"))
+        )
     
     def extract_html(self, driver):
         return driver.page_source
@@ -24,19 +28,19 @@ class FHLBScraper:
         short_term_tab = WebDriverWait(driver, 10).until(EC.element_to_be_clickable((By.XPATH,selector)))
 
         short_term_tab.click()
-        time.sleep(1)
-        pass
+        WebDriverWait(driver, PAGE_LOAD_TIMEOUT).until(
+            EC.visibility_of_element_located((By.CSS_SELECTOR, "#short-term-fixed .table-daily-rates tbody tr"))
+        )
 
     def parse_rates(self, html,selectors):
-        soup = BeautifulSoup(html, "html.parser")
-        table = soup.select_one(selectors)
+        table = LexborHTMLParser(html).css_first(selectors)
         data = []
         if table:
-            for row in table.find_all("tr")[2:]:
-                cols = row.find_all("td")
+            for row in table.css("tr")[2:]:
+                cols = row.css("td")
                 if len(cols) >= 2:
-                    term = cols[0].get_text(strip=True)
-                    regular = cols[2].get_text(strip=True)
+                    term = cols[0].text(strip=True)
+                    regular = cols[2].text(strip=True)
                     if term and regular and "%" in regular:
                         data.append((term, regular))
 
@@ -44,21 +48,35 @@ class FHLBScraper:
 
     def scrape_rates(self, url="https://www.fhlbc.com/"):
         rates = {}
+        long_term_selectors= "#long-term-fixed .table-daily-rates"
+        short_term_selectors = "#short-term-fixed .table-daily-rates"
+        
+        # Both tab panes are in the served DOM, so a plain GET avoids starting Chrome
+        html = fetch_static_html(url)
+        if html:
+            long_term_rates = self.parse_rates(html, long_term_selectors)
+            short_term_rates = self.parse_rates(html, short_term_selectors)
+        if not html or long_term_rates.empty or short_term_rates.empty:
+            long_term_rates, short_term_rates = self._scrape_with_browser(
+                url, long_term_selectors, short_term_selectors
+            )
+        
+        rates['timestamp'] =datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        rates['long_term_fixed'] = long_term_rates
+        rates['short_term_fixed'] = short_term_rates
+        return rates
+
+    def _scrape_with_browser(self, url, long_term_selectors, short_term_selectors):
         with WebDriverContext(headless=True) as driver:
-            long_term_selectors= "#long-term-fixed .table-daily-rates"
-            short_term_selectors = "#short-term-fixed .table-daily-rates"
             short_term_tab_selector =  "//a[@href='#short-term-fixed']"
             self.get_page(driver, url)
-            long_term_html = self.extract_html(driver)
             self.go_to_short_term_fixed(driver,short_term_tab_selector)
-
-            short_term_html = self.extract_html(driver)
-            long_term_rates = self.parse_rates(long_term_html, long_term_selectors)
-            short_term_rates = self.parse_rates(short_term_html, short_term_selectors)
-            rates['timestamp'] =datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            rates['long_term_fixed'] = long_term_rates
-            rates['short_term_fixed'] = short_term_rates
-            return rates
+            # The long-term pane stays in the DOM after the click, so one snapshot serves both tables
+            html = self.extract_html(driver)
+        return (
+            self.parse_rates(html, long_term_selectors),
+            self.parse_rates(html, short_term_selectors)
+        )
 
     def run_pipeline(self):
         return self.scrape_rates()
@@ -1,5 +1,6 @@
+import logging
 import pandas as pd
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 import re
 #from scrapers.web_driver import WebDriverContext
 from selenium.webdriver.common.by import By
@@ -9,7 +10,6 @@ from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from webdriver_manager.chrome import ChromeDriverManager
-import time
 
 class WebDriverContext:
     def __init__(self, headless=True):
@@ -37,41 +37,44 @@ class WebDriverContext:
         if self.driver:
             self.driver.quit()
 
+g_logger = logging.getLogger(__name__)
+
+PAGE_LOAD_TIMEOUT = 10
+
 class FHLBScraper:
     def __init__(self, wait_time=1):
         self.wait_time = wait_time
 
     def get_page(self, driver, url):
         driver.get(url)
-        time.sleep(self.wait_time)
+        WebDriverWait(driver, PAGE_LOAD_TIMEOUT).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, "#long-term-fixed .table-daily-rates"))
+        )
     
     def go_to_short_term_fixed(self,driver ):
         short_term_tab = WebDriverWait(driver, 10).until(EC.element_to_be_clickable((By.XPATH, "//a[@href='#short-term-fixed']")))
         short_term_tab.click()
-        time.sleep(1)
-        pass
+        WebDriverWait(driver, PAGE_LOAD_TIMEOUT).until(
+            EC.visibility_of_element_located((By.CSS_SELECTOR, "#short-term-fixed .table-daily-rates tbody tr"))
+        )
 
     def extract_html(self, driver):
         return driver.page_source
 
     def parse_rates(self, html):
-        soup = BeautifulSoup(html, "html.parser")
-        table = soup.select_one("#short-term-fixed .table-daily-rates")
+        table = LexborHTMLParser(html).css_first("#short-term-fixed .table-daily-rates")
 
         data = []
         if table:
-            for row in table.find_all("tr")[2:]:
+            for row in table.css("tr")[2:]:
                 #print("Processing row",row)
-                cols = row.find_all("td")
-                print("Columns found:", len(cols))
-                print("------------------------------------------------")
+                cols = row.css("td")
                 if len(cols) >= 3:
-                    term = cols[0].get_text(strip=True)
-                    regular = cols[2].get_text(strip=True)
-                    print(f"Term: {term}, Regular Rate: {regular}")
+                    term = cols[0].text(strip=True)
+                    regular = cols[2].text(strip=True)
+                    g_logger.debug("row cols=%d term=%s rate=%s", len(cols), term, regular)
                     if  term and regular and "%" in regular:
                         data.append((term, regular))
-        print(data)
         return pd.DataFrame(data, columns=["Term", "Regular Rate (%)"])
 
     def scrape_rates(self, url="https://www.fhlbc.com/"):
@@ -0,0 +1,28 @@
+import logging
+from typing import Optional
+
+import requests
+
+g_logger = logging.getLogger(__name__)
+
+_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/126.0 Safari/537.36"
+    ),
+    "Accept": "text/html,application/xhtml+xml",
+    "Accept-Encoding": "gzip",
+}
+_session = requests.Session()
+_session.headers.update(_HEADERS)
+
+
+def fetch_static_html(url: str, timeout: int = 10) -> Optional[str]:
+    """Fetch a page without a browser; returns None so callers can fall back to Selenium"""
+    try:
+        response = _session.get(url, timeout=timeout)
+        response.raise_for_status()
+        return response.text
+    except requests.RequestException as err:
+        g_logger.warning("Static fetch of %s failed: %s", url, err)
+        return None
@@ -1,59 +1,132 @@
+import atexit
+import threading
+
 from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from webdriver_manager.chrome import ChromeDriverManager
 
+# One Chrome per process; each WebDriverContext borrows it for a fresh tab.
+# The lock serializes borrowers because a driver has a single active window.
+_shared_driver = None
+_driver_lock = threading.RLock()
+# Resolved once; ChromeDriverManager().install() checks the disk (and sometimes the network) on every call
+_DRIVER_PATH = None
+
+
+def _build_options(headless):
+    options = Options()
+    options.headless = headless
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--window-size=1920,1080")
+    options.add_argument("--headless")
+    options.add_argument("--log-level=3")
+    options.add_experimental_option("excludeSwitches", ["enable-logging"])
+
+    options.add_argument('--disable-background-timer-throttling')
+    options.add_argument('--disable-backgrounding-occluded-windows')
+    options.add_argument('--disable-renderer-backgrounding')
+    options.add_argument('--disable-web-security')
+    options.add_argument('--disable-ipc-flooding-protection')
+    options.add_argument('--disable-hang-monitor')
+    options.add_argument('--disable-client-side-phishing-detection')
+    options.add_argument('--disable-popup-blocking')
+    options.add_argument('--disable-prompt-on-repost')
+    options.add_argument('--no-first-run')
+    options.add_argument('--no-service-autorun')
+    options.add_argument('--password-store=basic')
+    options.add_argument('--use-mock-keychain')
+
+    options.add_argument('--memory-pressure-off')
+    options.add_argument('--max_old_space_size=4096')
+    options.add_argument('--aggressive-cache-discard')
+
+    options.add_argument('--disable-background-networking')
+    options.add_argument('--disable-default-apps')
+    options.add_argument('--disable-extensions')
+    options.add_argument('--disable-sync')
+    options.add_argument('--disable-translate')
+    options.add_argument('--hide-scrollbars')
+    options.add_argument('--metrics-recording-only')
+    options.add_argument('--mute-audio')
+    options.add_argument('--no-default-browser-check')
+    options.add_argument('--safebrowsing-disable-auto-update')
+
+    # The scrapers only read table markup: skip images and stop waiting at DOMContentLoaded
+    options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2
+    })
+    options.page_load_strategy = 'eager'
+    return options
+
+
+def _quit_shared_driver():
+    global _shared_driver
+    with _driver_lock:
+        if _shared_driver is not None:
+            try:
+                _shared_driver.quit()
+            except WebDriverException:
+                pass
+            _shared_driver = None
+
+
+def _driver_path():
+    global _DRIVER_PATH
+    with _driver_lock:
+        if _DRIVER_PATH is None:
+            _DRIVER_PATH = ChromeDriverManager().install()
+        return _DRIVER_PATH
+
+
+def _get_shared_driver(headless):
+    global _shared_driver
+    if _shared_driver is not None:
+        try:
+            _shared_driver.current_window_handle
+            return _shared_driver
+        except WebDriverException:
+            # Chrome crashed or was closed; start a new one
+            _quit_shared_driver()
+    _shared_driver = webdriver.Chrome(
+        service=Service(_driver_path()),
+        options=_build_options(headless)
+    )
+    return _shared_driver
+
+
+atexit.register(_quit_shared_driver)
+
+
 class WebDriverContext:
     def __init__(self, headless=True):
         self.headless = headless
         self.driver = None
+        self._base_handle = None
 
     def __enter__(self):
-        options = Options()
-        options.headless = self.headless
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        options.add_argument("--disable-gpu")
-        options.add_argument("--window-size=1920,1080")
-        options.add_argument("--headless") 
-        options.add_argument("--log-level=3") 
-        options.add_experimental_option("excludeSwitches", ["enable-logging"])
-
-        options.add_argument('--disable-background-timer-throttling')
-        options.add_argument('--disable-backgrounding-occluded-windows')
-        options.add_argument('--disable-renderer-backgrounding')
-        options.add_argument('--disable-web-security')
-        options.add_argument('--disable-ipc-flooding-protection')
-        options.add_argument('--disable-hang-monitor')
-        options.add_argument('--disable-client-side-phishing-detection')
-        options.add_argument('--disable-popup-blocking')
-        options.add_argument('--disable-prompt-on-repost')
-        options.add_argument('--no-first-run')
-        options.add_argument('--no-service-autorun')
-        options.add_argument('--password-store=basic')
-        options.add_argument('--use-mock-keychain')
-        
-        options.add_argument('--memory-pressure-off')
-        options.add_argument('--max_old_space_size=4096')
-        options.add_argument('--aggressive-cache-discard')
-        
-        options.add_argument('--disable-background-networking')
-        options.add_argument('--disable-default-apps')
-        options.add_argument('--disable-extensions')
-        options.add_argument('--disable-sync')
-        options.add_argument('--disable-translate')
-        options.add_argument('--hide-scrollbars')
-        options.add_argument('--metrics-recording-only')
-        options.add_argument('--mute-audio')
-        options.add_argument('--no-default-browser-check')
-        options.add_argument('--safebrowsing-disable-auto-update')
-
-        self.driver = webdriver.Chrome(
-            service=Service(ChromeDriverManager().install()),
-            options=options
-        )
+        _driver_lock.acquire()
+        try:
+            driver = _get_shared_driver(self.headless)
+            self._base_handle = driver.current_window_handle
+            driver.switch_to.new_window('tab')
+        except BaseException:
+            _driver_lock.release()
+            raise
+        self.driver = driver
         return self.driver
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        if self.driver:
-            self.driver.quit()
+        try:
+            if self.driver:
+                # Close only our tab; the base tab keeps the browser alive for the next caller
+                self.driver.close()
+                self.driver.switch_to.window(self._base_handle)
+        except WebDriverException:
+            _quit_shared_driver()
+        finally:
+            self.driver = None
+            _driver_lock.release()
@@ -1,28 +1,83 @@
+import duckdb
+import numpy as np
 import pandas as pd
+import streamlit as st
 from datetime import datetime, date
 from io import StringIO
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional, Union
+
+# Below this many logins DuckDB's per-query setup costs more than the pandas groupby it replaces
+DUCKDB_MIN_ROWS = 1000
+
+_USER_SUMMARY_SQL = """
+    SELECT username,
+           COUNT(*) AS "Total Logins",
+           MIN(date) AS "First Login Date",
+           MAX(date) AS "Last Login Date"
+    FROM logins
+    GROUP BY username
+    ORDER BY "Total Logins" DESC
+"""
+
+_DAILY_ACTIVITY_SQL = """
+    SELECT date, COUNT(*) AS login_count
+    FROM logins
+    GROUP BY date
+    ORDER BY date
+"""
+
+
+def _duckdb_query(sql: str, logins: pd.DataFrame) -> pd.DataFrame:
+    """Run an aggregate over the logins frame on a private connection (safe across sessions)"""
+    with duckdb.connect() as con:
+        con.register('logins', logins)
+        return con.sql(sql).df()
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _parse_logs(raw_logs: str) -> pd.DataFrame:
+    """Parse the activity CSV once per distinct log contents"""
+    # Arrow parses the CSV multithreaded into one contiguous array per column
+    df = pd.read_csv(
+        StringIO(raw_logs),
+        parse_dates=['timestamp'],
+        dtype={'event': 'category'},
+        engine='pyarrow'
+    )
+    if not df.empty:
+        # Day-resolution datetime64 instead of Python date objects
+        df['date'] = df['timestamp'].dt.normalize()
+    return df
+
 
 class UserActivityAnalytics:
     """Data processing class for user activity analytics"""
     
-    def __init__(self, raw_logs: str):
-        """Initialize with raw log data"""
+    def __init__(self, raw_logs: Union[str, pd.DataFrame]):
+        """Initialize with raw log text or a frame already returned by _parse_logs"""
         self.raw_logs = raw_logs
         self.df = None
         self._process_logs()
     
     def _process_logs(self) -> None:
         """Process raw logs into DataFrame"""
-        if not self.raw_logs or self.raw_logs.strip() == "":
+        if isinstance(self.raw_logs, pd.DataFrame):
+            self.df = self.raw_logs
+        elif not self.raw_logs or self.raw_logs.strip() == "":
             self.df = pd.DataFrame()
             return
             
         try:
-            self.df = pd.read_csv(StringIO(self.raw_logs))
+            if self.df is None:
+                self.df = _parse_logs(self.raw_logs)
             if not self.df.empty:
-                self.df['timestamp'] = pd.to_datetime(self.df['timestamp'])
-                self.df['date'] = self.df['timestamp'].dt.date
+                # Date filters only ever look at logins, so split and sort them once
+                self._logins = (
+                    self.df[self.df['event'] == 'login']
+                    .sort_values('date', kind='stable')
+                    .reset_index(drop=True)
+                )
+                self._login_dates = self._logins['date'].to_numpy()
         except Exception as e:
             print(f"Error processing logs: {e}")
             self.df = pd.DataFrame()
@@ -35,29 +90,26 @@ class UserActivityAnalytics:
         """Get the date range of available data"""
         if self.df.empty:
             return None, None
-        return self.df['date'].min(), self.df['date'].max()
+        return self.df['date'].min().date(), self.df['date'].max().date()
     
     def filter_by_date_range(self, start_date: date, end_date: date) -> pd.DataFrame:
         """Filter data by date range and login events only"""
         if self.df.empty:
             return pd.DataFrame()
         
-        filtered = self.df[
-            (self.df['date'] >= start_date) & 
-            (self.df['date'] <= end_date) &
-            (self.df['event'] == 'login')
-        ]
-        return filtered
+        lo = self._login_dates.searchsorted(np.datetime64(start_date, 'D'), side='left')
+        hi = self._login_dates.searchsorted(np.datetime64(end_date, 'D'), side='right')
+        return self._logins.iloc[lo:hi]
     
     def get_user_summary(self, filtered_df: pd.DataFrame) -> pd.DataFrame:
         """Generate user login summary statistics"""
         if filtered_df.empty:
             return pd.DataFrame()
         
-        summary = filtered_df.groupby('username').agg({
-            'timestamp': 'count',
-            'date': ['min', 'max']
-        }).round(2)
+        if len(filtered_df) >= DUCKDB_MIN_ROWS:
+            return _duckdb_query(_USER_SUMMARY_SQL, filtered_df[['username', 'date']])
+        
+        summary = filtered_df.groupby('username', sort=False)['date'].agg(['count', 'min', 'max'])
         
         summary.columns = ['Total Logins', 'First Login Date', 'Last Login Date']
         summary = summary.reset_index()
@@ -93,7 +145,7 @@ class UserActivityAnalytics:
             return user_summary
         
         return user_summary[
-            user_summary['username'].str.contains(search_term, case=False, na=False)
+            user_summary['username'].str.contains(search_term, case=False, regex=False, na=False)
         ]
     
     def get_daily_activity(self, filtered_df: pd.DataFrame) -> pd.DataFrame:
@@ -101,7 +153,14 @@ class UserActivityAnalytics:
         if filtered_df.empty:
             return pd.DataFrame()
         
-        daily_activity = filtered_df.groupby('date').size().reset_index(name='login_count')
+        if len(filtered_df) >= DUCKDB_MIN_ROWS:
+            return _duckdb_query(_DAILY_ACTIVITY_SQL, filtered_df[['date']])
+        
+        daily_activity = (
+            filtered_df['date'].value_counts(sort=False)
+            .rename_axis('date').reset_index(name='login_count')
+            .sort_values('date', ignore_index=True)
+        )
         return daily_activity
     
     def get_heatmap_data(self, filtered_df: pd.DataFrame) -> pd.DataFrame:
@@ -109,13 +168,9 @@ class UserActivityAnalytics:
         if filtered_df.empty:
             return pd.DataFrame()
         
-        heatmap_data = filtered_df.pivot_table(
-            index='username',
-            columns='date',
-            values='timestamp',
-            aggfunc='count',
-            fill_value=0
-        )
+        heatmap_data = pd.crosstab(filtered_df['username'], filtered_df['date'])
+        # Keep the day labels the charts have always shown
+        heatmap_data.columns = heatmap_data.columns.strftime('%Y-%m-%d').rename('date')
         return heatmap_data
     
     def export_summary_csv(self, user_summary: pd.DataFrame) -> str:
@@ -1,15 +1,21 @@
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
 import sys
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
-import json
+import orjson
 import gzip
 import shutil
+import threading
 from typing import Optional, Dict, Any
 
 
+_ANSI_RESET = '\033[0m'
+
+
 class ColoredFormatter(logging.Formatter):
     
     COLORS = {
@@ -18,20 +24,26 @@ class ColoredFormatter(logging.Formatter):
         'WARNING': '\033[33m',
         'ERROR': '\033[31m',
         'CRITICAL': '\033[35m',
-        'RESET': '\033[0m'
+        'RESET': _ANSI_RESET
     }
     
+    _WRAPPED = {level: f"{color}{level}{_ANSI_RESET}" for level, color in COLORS.items() if level != 'RESET'}
+    
     def format(self, record):
-        log_color = self.COLORS.get(record.levelname, self.COLORS['RESET'])
-        record.levelname = f"{log_color}{record.levelname}{self.COLORS['RESET']}"
-        return super().format(record)
+        # Restore the level name so other handlers sharing the record see it uncolored
+        levelname = record.levelname
+        record.levelname = self._WRAPPED.get(levelname) or f"{self.COLORS['RESET']}{levelname}{self.COLORS['RESET']}"
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = levelname
 
 
 class JSONFormatter(logging.Formatter):
     
     def format(self, record):
         log_entry = {
-            'timestamp': datetime.fromtimestamp(record.created).isoformat(),
+            'timestamp': datetime.fromtimestamp(record.created, tz=timezone.utc),
             'level': record.levelname,
             'logger': record.name,
             'message': record.getMessage(),
@@ -42,13 +54,15 @@ class JSONFormatter(logging.Formatter):
             'process': record.process
         }
         
-        if hasattr(record, 'extra_data'):
-            log_entry['extra'] = record.extra_data
+        extra_data = getattr(record, 'extra_data', None)
+        if extra_data is not None:
+            log_entry['extra'] = extra_data
             
         if record.exc_info:
             log_entry['exception'] = self.formatException(record.exc_info)
             
-        return json.dumps(log_entry, ensure_ascii=False)
+        # orjson serializes the datetime natively; str() covers arbitrary extra payloads
+        return orjson.dumps(log_entry, default=str, option=orjson.OPT_UTC_Z).decode()
 
 
 class CompressedTimedRotatingFileHandler(logging.handlers.TimedRotatingFileHandler):
@@ -61,15 +75,51 @@ class CompressedTimedRotatingFileHandler(logging.handlers.TimedRotatingFileHandl
     def doRollover(self):
         super().doRollover()
         if self.backupCount > 0:
-            for i in range(self.backupCount, 0, -1):
-                sfn = self.rotation_filename(f"{self.baseFilename}.{i}")
-                if os.path.exists(sfn) and not sfn.endswith('.gz'):
-                    base_name = Path(sfn).name
-                    archived_path = self.archive_dir / f"{base_name}.gz"
-                    with open(sfn, 'rb') as f_in:
-                        with gzip.open(archived_path, 'wb') as f_out:
-                            shutil.copyfileobj(f_in, f_out)
-                    os.remove(sfn)
+            # Compress off the logging thread so emitters never wait on gzip
+            threading.Thread(target=self._archive_rotated_files, daemon=True).start()
+    
+    def _archive_rotated_files(self):
+        base_path = Path(self.baseFilename)
+        # Timed rotation names backups "<file>.<date suffix>"
+        for rotated in base_path.parent.glob(f"{base_path.name}.*"):
+            if rotated.suffix == '.gz':
+                continue
+            archived_path = self.archive_dir / f"{rotated.name}.gz"
+            try:
+                with open(rotated, 'rb') as f_in:
+                    with gzip.open(archived_path, 'wb', compresslevel=1) as f_out:
+                        shutil.copyfileobj(f_in, f_out, length=1 << 20)
+                os.remove(rotated)
+            except OSError:
+                continue
+
+
+_active_listener = None
+# Guards the root handler swap and the cached config; Streamlit sessions rerun concurrently
+_setup_lock = threading.RLock()
+_active_config = None
+
+
+def _stop_listener():
+    global _active_listener
+    with _setup_lock:
+        if _active_listener is not None:
+            _active_listener.stop()
+            for handler in _active_listener.handlers:
+                handler.close()
+            _active_listener = None
+
+
+def _start_listener(listener):
+    """Replace the running listener so reconfiguring does not leak threads or file handles"""
+    global _active_listener
+    with _setup_lock:
+        _stop_listener()
+        _active_listener = listener
+        listener.start()
+
+
+atexit.register(_stop_listener)
 
 
 class LoggerConfig:
@@ -98,10 +148,15 @@ class LoggerConfig:
         self._setup_logger()
     
     def _setup_logger(self):
+        with _setup_lock:
+            self._configure_root()
+    
+    def _configure_root(self):
         
         root_logger = logging.getLogger()
         root_logger.setLevel(self.log_level)
         root_logger.handlers.clear()
+        handlers = []
         
         if self.json_format:
             file_formatter = JSONFormatter()
@@ -136,7 +191,7 @@ class LoggerConfig:
         
         file_handler.setLevel(self.log_level)
         file_handler.setFormatter(file_formatter)
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
         
         error_log_file = self.log_dir / f"{self.app_name}_errors.log"
         if self.compression:
@@ -157,13 +212,13 @@ class LoggerConfig:
             )
         error_handler.setLevel(logging.ERROR)
         error_handler.setFormatter(file_formatter)
-        root_logger.addHandler(error_handler)
+        handlers.append(error_handler)
         
         if self.console_output:
             console_handler = logging.StreamHandler(sys.stdout)
             console_handler.setLevel(self.log_level)
             console_handler.setFormatter(console_formatter)
-            root_logger.addHandler(console_handler)
+            handlers.append(console_handler)
         
         if self.log_level == logging.DEBUG:
             debug_log_file = self.log_dir / f"{self.app_name}_debug.log"
@@ -185,18 +240,30 @@ class LoggerConfig:
                 )
             debug_handler.setLevel(logging.DEBUG)
             debug_handler.setFormatter(file_formatter)
-            root_logger.addHandler(debug_handler)
+            handlers.append(debug_handler)
+        
+        # Callers only enqueue records; formatting and file/gzip I/O happen on the listener thread
+        log_queue = queue.SimpleQueue()
+        root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        _start_listener(logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True))
     
     def get_logger(self, name: str = None) -> logging.Logger:
         return logging.getLogger(name or self.app_name)
     
     def log_system_info(self):
+        """Log the startup banner.
+
+        Convention for every logger configured here: pass arguments %-style
+        (logger.debug("rows=%d", n)) rather than as f-strings so disabled levels
+        skip formatting, and wrap DEBUG calls whose arguments are expensive to
+        build in logger.isEnabledFor(logging.DEBUG).
+        """
         logger = self.get_logger()
         logger.info("="*60)
-        logger.info(f"Starting application: {self.app_name}")
-        logger.info(f"Python: {sys.version}")
-        logger.info(f"Log directory: {self.log_dir.absolute()}")
-        logger.info(f"Logging level: {logging.getLevelName(self.log_level)}")
+        logger.info("Starting application: %s", self.app_name)
+        logger.info("Python: %s", sys.version)
+        logger.info("Log directory: %s", self.log_dir.absolute())
+        logger.info("Logging level: %s", logging.getLevelName(self.log_level))
         logger.info("="*60)
 
 
@@ -205,14 +272,21 @@ def setup_logging(app_name: str = "MyApp",
                  log_dir: str = "logs",
                  console_output: bool = True,
                  json_format: bool = False) -> LoggerConfig:
-    
-    config = LoggerConfig(
-        app_name=app_name,
-        log_level=log_level,
-        log_dir=log_dir,
-        console_output=console_output,
-        json_format=json_format
-    )
+    """Configure process-wide logging once; later calls with the same settings reuse it"""
+    global _active_config
+    key = (app_name, log_level.upper(), str(log_dir), console_output, json_format)
+    with _setup_lock:
+        if _active_config is not None and _active_config[0] == key:
+            return _active_config[1]
+        
+        config = LoggerConfig(
+            app_name=app_name,
+            log_level=log_level,
+            log_dir=log_dir,
+            console_output=console_output,
+            json_format=json_format
+        )
+        _active_config = (key, config)
     
     config.log_system_info()
     return config
@@ -240,6 +314,11 @@ if __name__ == "__main__":
         logger.exception("Zero division error caught")
     
     extra_logger = log_config.get_logger("database")
-    extra_logger.info("Query executed", extra={'query_time': 0.045, 'rows': 150})
+    query_time, rows = 0.045, 150
+    extra_logger.info("Query executed time=%s rows=%s", query_time, rows,
+                      extra={'query_time': query_time, 'rows': rows})
+    
+    if extra_logger.isEnabledFor(logging.DEBUG):
+        extra_logger.debug("Query plan: %s", " -> ".join(["scan", "filter", "project"]))
     
     logger.info("Logging example completed")
\ No newline at end of file
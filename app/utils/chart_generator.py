@@ -3,26 +3,40 @@ Chart generation module for Banking Rates Dashboard
 Handles all visualization and chart creation
 """
 
+import matplotlib
+matplotlib.use("Agg")
 import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 import altair as alt
+import numpy as np
 import pandas as pd
+import streamlit as st
 import io
 from typing import Tuple, Optional
 
+# Above this many user/day cells the heatmap is rasterized server-side instead of sent as Vega rects
+HEATMAP_RASTER_CELLS = 5000
+
+# Altair specs are immutable once built, so identical frames (hashed by content) reuse one chart
+_cache_chart = st.cache_resource(max_entries=64, show_spinner=False)
+
 
 class ChartGenerator:
     """Main chart generation class"""
     
+    @staticmethod
+    def _new_fig() -> Tuple[plt.Figure, plt.Axes]:
+        """Return a fresh figure outside pyplot's global registry, so nothing needs closing"""
+        fig = Figure(figsize=ChartStyler.DEFAULT_FIGURE_SIZE)
+        return fig, fig.subplots()
+    
     @staticmethod
     def create_time_series_chart(df: pd.DataFrame, title: str, 
                                rate_name: str, color: str = "steelblue") -> plt.Figure:
         """Create a time series chart for rate data"""
-        fig, ax = plt.subplots(figsize=(10, 4))
+        fig, ax = ChartGenerator._new_fig()
         ax.plot(df.index, df['value'], label=rate_name, color=color, linewidth=2)
-        ax.set_title(f"{title}", fontsize=14)
-        ax.set_xlabel("Date", fontsize=12)
-        ax.set_ylabel("Rate (%)", fontsize=12)
-        ax.grid(which="major", linestyle="--", linewidth=0.5, color="gray", alpha=0.7)
+        ChartStyler.apply_default_style(ax, f"{title}")
         ax.legend()
         fig.tight_layout()
         return fig
@@ -31,13 +45,10 @@ class ChartGenerator:
     def create_custom_rate_chart(custom_series: pd.Series, 
                                rate_name: str, color: str = "darkgreen") -> plt.Figure:
         """Create chart for custom rate series"""
-        fig, ax = plt.subplots(figsize=(10, 4))
+        fig, ax = ChartGenerator._new_fig()
         ax.plot(custom_series.index, custom_series, label="Custom Rate", 
                 color=color, linewidth=2)
-        ax.set_title(f"{rate_name} Over Time", fontsize=14)
-        ax.set_xlabel("Date", fontsize=12)
-        ax.set_ylabel("Rate (%)", fontsize=12)
-        ax.grid(which="major", linestyle="--", linewidth=0.5, color="gray", alpha=0.7)
+        ChartStyler.apply_default_style(ax, f"{rate_name} Over Time")
         ax.legend()
         fig.tight_layout()
         return fig
@@ -45,7 +56,7 @@ class ChartGenerator:
     @staticmethod
     def create_fhlb_rate_curve(fhlb_df: pd.DataFrame) -> plt.Figure:
         """Create FHLB rate curve chart"""
-        fig, ax = plt.subplots(figsize=(10, 4))
+        fig, ax = ChartGenerator._new_fig()
         ax.plot(fhlb_df["Term"], fhlb_df["Regular Rate (%)"], 
                 marker='o', linestyle='-', color='mediumblue')
         ax.set_title("Interest Rate Curve", fontsize=14)
@@ -56,6 +67,54 @@ class ChartGenerator:
         return fig
     
     @staticmethod
+    def _rate_line_chart(data: pd.DataFrame, title: str, color: str) -> alt.Chart:
+        """Client-side rendered Date/Rate line shared by the on-screen rate charts"""
+        return alt.Chart(data).mark_line(color=color, strokeWidth=2).encode(
+            x=alt.X('Date:T', title='Date'),
+            y=alt.Y('Rate:Q', title='Rate (%)', scale=alt.Scale(zero=False)),
+            tooltip=['Date:T', 'Rate:Q']
+        ).properties(
+            title=title,
+            width=700,
+            height=300
+        )
+    
+    @staticmethod
+    @_cache_chart
+    def create_time_series_altair_chart(df: pd.DataFrame, title: str,
+                                        rate_name: str, color: str = "steelblue") -> alt.Chart:
+        """Create an Altair time series chart for rate data"""
+        data = pd.DataFrame({'Date': df.index, 'Rate': df['value'].to_numpy()})
+        return ChartGenerator._rate_line_chart(data, title, color)
+    
+    @staticmethod
+    @_cache_chart
+    def create_custom_rate_altair_chart(custom_series: pd.Series,
+                                        rate_name: str, color: str = "darkgreen") -> alt.Chart:
+        """Create an Altair chart for custom rate series"""
+        data = pd.DataFrame({'Date': custom_series.index, 'Rate': custom_series.to_numpy()})
+        return ChartGenerator._rate_line_chart(data, f"{rate_name} Over Time", color)
+    
+    @staticmethod
+    @_cache_chart
+    def create_fhlb_rate_curve_altair(fhlb_df: pd.DataFrame) -> alt.Chart:
+        """Create an Altair FHLB rate curve chart"""
+        data = pd.DataFrame({
+            'Term': fhlb_df["Term"].to_numpy(),
+            'Rate': pd.to_numeric(fhlb_df["Regular Rate (%)"].str.rstrip('%'), errors='coerce').to_numpy()
+        })
+        return alt.Chart(data).mark_line(point=True, color='mediumblue').encode(
+            x=alt.X('Term:N', title='FHLB', sort=None),
+            y=alt.Y('Rate:Q', title='Rate (%)', scale=alt.Scale(zero=False)),
+            tooltip=['Term:N', 'Rate:Q']
+        ).properties(
+            title='Interest Rate Curve',
+            width=700,
+            height=300
+        )
+    
+    @staticmethod
+    @_cache_chart
     def create_cofi_yearly_chart(df_long: pd.DataFrame) -> alt.Chart:
         """Create Altair chart for yearly COFI rates"""
         chart = alt.Chart(df_long).mark_line(point=True).encode(
@@ -71,15 +130,15 @@ class ChartGenerator:
         return chart
     
     @staticmethod
+    @_cache_chart
     def create_cofi_monthly_chart(cofi_3_months: pd.DataFrame) -> alt.Chart:
         """Create Altair chart for monthly COFI rates"""
-        chart = alt.Chart(cofi_3_months).transform_loess(
-            'Date', 'COFI', bandwidth=0.5
-        ).mark_line(
+        # COFI_smooth is precomputed by CofiDataProcessor.process_monthly_cofi
+        chart = alt.Chart(cofi_3_months).mark_line(
             color='steelblue'
         ).encode(
             x=alt.X('Date:T', title='Date'),
-            y=alt.Y('COFI:Q', title='Rate %'),
+            y=alt.Y('COFI_smooth:Q', title='Rate %'),
             tooltip=['Date:T', 'COFI']
         ).properties(
             title='Soft evolution of 3-Month COFI',
@@ -89,14 +148,16 @@ class ChartGenerator:
         return chart
     
     @staticmethod
-    def save_chart_to_buffer(fig: plt.Figure) -> io.BytesIO:
-        """Save matplotlib figure to buffer for download"""
+    def save_chart_to_buffer(fig: plt.Figure) -> bytes:
+        """Render matplotlib figure to PNG bytes for download"""
         buf = io.BytesIO()
-        fig.savefig(buf, format="png")
-        buf.seek(0)
-        return buf
+        # Layout is fixed when the figure is built, so skip the tight-bbox measuring pass
+        fig.savefig(buf, format="png", dpi=72, bbox_inches=None, pad_inches=0.02,
+                    metadata={'Software': None})
+        return buf.getvalue()
 
     @staticmethod
+    @_cache_chart
     def create_user_login_bar_chart(user_summary: pd.DataFrame, top_n: int = 10) -> alt.Chart:
         """Create bar chart for user login counts using Altair"""
         if user_summary.empty:
@@ -108,7 +169,8 @@ class ChartGenerator:
                 width=400, height=200
             )
         
-        top_users = user_summary.head(top_n)
+        # Rank server-side and ship only the plotted columns; Vega keeps the row order
+        top_users = user_summary.nlargest(top_n, 'Total Logins')[['username', 'Total Logins']]
         
         chart = alt.Chart(top_users).mark_bar(
             color=alt.Gradient(
@@ -118,7 +180,7 @@ class ChartGenerator:
             )
         ).encode(
             x=alt.X('username:N', 
-                   sort=alt.EncodingSortField(field='Total Logins', order='descending'),
+                   sort=None,
                    title='Username',
                    axis=alt.Axis(labelAngle=-45)),
             y=alt.Y('Total Logins:Q', title='Total Logins'),
@@ -135,6 +197,7 @@ class ChartGenerator:
         return chart
     
     @staticmethod
+    @_cache_chart
     def create_daily_activity_line_chart(daily_activity: pd.DataFrame) -> alt.Chart:
         """Create line chart for daily login activity using Altair"""
         if daily_activity.empty:
@@ -182,7 +245,20 @@ class ChartGenerator:
         return chart
     
     @staticmethod
-    def create_activity_heatmap(heatmap_data: pd.DataFrame) -> alt.Chart:
+    def melt_heatmap(heatmap_data: pd.DataFrame) -> pd.DataFrame:
+        """Long-form (username, date, login_count) rows for the heatmap chart"""
+        # Row-major ravel of the count matrix lines up with users repeated and dates tiled
+        n_users, n_dates = heatmap_data.shape
+        return pd.DataFrame({
+            'username': np.repeat(heatmap_data.index.to_numpy(), n_dates),
+            'date': np.tile(heatmap_data.columns.astype(str).to_numpy(), n_users),
+            'login_count': heatmap_data.to_numpy().ravel()
+        })
+    
+    @staticmethod
+    @_cache_chart
+    def create_activity_heatmap(heatmap_data: pd.DataFrame,
+                                pre_melted: Optional[pd.DataFrame] = None) -> alt.Chart:
         """Create heatmap for user activity using Altair"""
         if heatmap_data.empty:
             return alt.Chart(pd.DataFrame({'message': ['No data available']})).mark_text(
@@ -193,12 +269,7 @@ class ChartGenerator:
                 width=400, height=200
             )
         
-        heatmap_melted = heatmap_data.reset_index().melt(
-            id_vars='username', 
-            var_name='date', 
-            value_name='login_count'
-        )
-        heatmap_melted['date'] = heatmap_melted['date'].astype(str)
+        heatmap_melted = pre_melted if pre_melted is not None else ChartGenerator.melt_heatmap(heatmap_data)
         
         chart = alt.Chart(heatmap_melted).mark_rect().encode(
             x=alt.X('date:O', title='Date', axis=alt.Axis(labelAngle=-45)),
@@ -216,6 +287,28 @@ class ChartGenerator:
         return chart
     
     @staticmethod
+    @_cache_chart
+    def create_activity_heatmap_image(heatmap_data: pd.DataFrame) -> bytes:
+        """Rasterize a large user activity heatmap to PNG bytes with matplotlib"""
+        n_users, n_dates = heatmap_data.shape
+        fig = Figure(figsize=(8, max(4, n_users * 0.25)))
+        ax = fig.subplots()
+        image = ax.imshow(heatmap_data.to_numpy(), aspect='auto', cmap='Blues', interpolation='nearest')
+        # Label about a dozen dates so the axis stays legible on long ranges
+        step = max(1, n_dates // 12)
+        ax.set_xticks(range(0, n_dates, step))
+        ax.set_xticklabels(heatmap_data.columns.astype(str)[::step], rotation=-45, ha='left')
+        ax.set_yticks(range(n_users))
+        ax.set_yticklabels(heatmap_data.index.astype(str))
+        ax.set_xlabel("Date")
+        ax.set_ylabel("Username")
+        ax.set_title("User Activity Heatmap", fontsize=14)
+        fig.colorbar(image, ax=ax, label="Login Count")
+        fig.tight_layout()
+        return ChartGenerator.save_chart_to_buffer(fig)
+    
+    @staticmethod
+    @_cache_chart
     def create_user_activity_pie_chart(user_summary: pd.DataFrame, top_n: int = 8) -> alt.Chart:
         """Create pie chart for user activity distribution using Altair"""
         if user_summary.empty:
@@ -227,15 +320,19 @@ class ChartGenerator:
                 width=400, height=200
             )
         
-        top_users = user_summary.head(top_n).copy()
-        others_count = user_summary.iloc[top_n:]['Total Logins'].sum() if len(user_summary) > top_n else 0
+        top_users = user_summary.nlargest(top_n, 'Total Logins')
+        others_count = user_summary['Total Logins'].sum() - top_users['Total Logins'].sum()
         
         if others_count > 0:
-            others_row = pd.DataFrame({
-                'username': [f'Others ({len(user_summary) - top_n} users)'],
-                'Total Logins': [others_count]
-            })
-            display_data = pd.concat([top_users[['username', 'Total Logins']], others_row], ignore_index=True)
+            # Fill the top users plus the "Others" slice in place rather than concatenating frames
+            n = len(top_users)
+            names = np.empty(n + 1, dtype=object)
+            names[:n] = top_users['username'].to_numpy()
+            names[n] = f'Others ({len(user_summary) - top_n} users)'
+            counts = np.empty(n + 1, dtype=np.int64)
+            counts[:n] = top_users['Total Logins'].to_numpy()
+            counts[n] = others_count
+            display_data = pd.DataFrame({'username': names, 'Total Logins': counts})
         else:
             display_data = top_users[['username', 'Total Logins']]
         
@@ -254,6 +351,7 @@ class ChartGenerator:
         return chart
     
     @staticmethod
+    @_cache_chart
     def create_login_frequency_histogram(user_summary: pd.DataFrame) -> alt.Chart:
         """Create histogram for login frequency distribution using Altair"""
         if user_summary.empty:
@@ -2,10 +2,44 @@ from reportlab.lib.pagesizes import letter
 from reportlab.pdfgen import canvas
 from reportlab.pdfbase.pdfmetrics import stringWidth
 from io import BytesIO
+import functools
+import string
+import numpy as np
 import pandas as pd
+import streamlit as st
 from datetime import datetime
 
-def generate_pdf_from_df(df: pd.DataFrame, title: str) -> BytesIO:
+_string_width = functools.lru_cache(maxsize=8192)(stringWidth)
+# Helvetica has fixed per-glyph metrics and stringWidth applies no kerning, so ASCII text is a plain sum
+_CHAR_WIDTHS = {ch: stringWidth(ch, "Helvetica", 10) for ch in string.printable}
+
+
+def _text_width(text: str) -> float:
+    """Helvetica 10pt width of a cell, skipping the font lookup for printable ASCII"""
+    if all(ch in _CHAR_WIDTHS for ch in text):
+        return sum(_CHAR_WIDTHS[ch] for ch in text)
+    return _string_width(text, "Helvetica", 10)
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def generate_pdf_from_df(df: pd.DataFrame, title: str) -> bytes:
+    """Cached PDF export; reruns with an unchanged frame and title skip the canvas draw"""
+    return _render_pdf(df, title)
+
+
+def _draw_row(c: canvas.Canvas, x0: float, y: float, col_widths: list, cells) -> None:
+    """Emit a table row as one text object, stepping the cursor by column width"""
+    text = c.beginText()
+    text.setFont("Helvetica", 10)
+    text.setTextOrigin(x0, y)
+    for i, val in enumerate(cells):
+        if i:
+            text.moveCursor(col_widths[i - 1], 0)
+        text.textOut(val)
+    c.drawText(text)
+
+
+def _render_pdf(df: pd.DataFrame, title: str) -> bytes:
     buffer = BytesIO()
     c = canvas.Canvas(buffer, pagesize=letter)
     width, height = letter
@@ -18,33 +52,34 @@ def generate_pdf_from_df(df: pd.DataFrame, title: str) -> BytesIO:
     y = height - 80
     line_height = 18
 
+    # Stringify every cell once; width estimation and drawing both read this array
+    headers = [str(col) for col in df.columns]
+    str_arr = df.astype(str).to_numpy(dtype=str)
+    lens = np.char.str_len(str_arr)
+    longest = lens.argmax(axis=0) if len(str_arr) else None
+
     # Estimate column widths
     col_widths = []
-    for col in df.columns:
-        max_text = max([str(x) for x in df[col]] + [col], key=len)
-        col_width = stringWidth(max_text, "Helvetica", 10) + 20
+    for i, header in enumerate(headers):
+        max_text = header
+        if longest is not None and lens[longest[i], i] >= len(header):
+            max_text = str_arr[longest[i], i]
+        col_width = _text_width(max_text) + 20
         col_widths.append(col_width)
 
-    x_positions = [40]
-    for w in col_widths[:-1]:
-        x_positions.append(x_positions[-1] + w)
-
     # Draw header
-    for i, col in enumerate(df.columns):
-        c.drawString(x_positions[i], y, str(col))
+    _draw_row(c, 40, y, col_widths, headers)
     y -= line_height
 
     # Draw data rows
-    for _, row in df.iterrows():
-        for i, val in enumerate(row):
-            c.drawString(x_positions[i], y, str(val))
+    for row in str_arr:
+        _draw_row(c, 40, y, col_widths, row)
         y -= line_height
         if y < 100:
             c.showPage()
             y = height - 50
             c.setFont("Helvetica", 10)
-            for i, col in enumerate(df.columns):
-                c.drawString(x_positions[i], y, str(col))
+            _draw_row(c, 40, y, col_widths, headers)
             y -= line_height
 
     # Signature section
@@ -71,5 +106,4 @@ def generate_pdf_from_df(df: pd.DataFrame, title: str) -> BytesIO:
     c.drawString(40, 30, timestamp)
 
     c.save()
-    buffer.seek(0)
-    return buffer
+    return buffer.getvalue()
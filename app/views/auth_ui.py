@@ -1,12 +1,55 @@
 import streamlit as st
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import date
 from data_service.data_processor import DataProcessor, CofiDataProcessor
 from data_service.user_activity_processor import UserActivityAnalytics
-from utils.chart_generator import ChartGenerator
+from utils.chart_generator import ChartGenerator, HEATMAP_RASTER_CELLS
 from auth.session_manager import SessionStateManager
 from constants.auth import permissions
-from typing import Dict
+from typing import Dict, Optional
+
+
+@dataclass(frozen=True)
+class _ActivityViz:
+    """Frames shared by the activity summary, its charts and exports"""
+    filtered_df: pd.DataFrame
+    user_summary: pd.DataFrame
+    metrics: Dict
+    daily_activity: pd.DataFrame
+    heatmap_data: pd.DataFrame
+    heatmap_melted: Optional[pd.DataFrame]
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _precompute_viz(logs: str, start_date: date, end_date: date) -> Optional[_ActivityViz]:
+    """Filter and aggregate the logs once per (logs, date range); None when no logins match"""
+    analytics = UserActivityAnalytics(logs)
+    filtered_df = analytics.filter_by_date_range(start_date, end_date)
+    if filtered_df.empty:
+        return None
+    # The three aggregations are independent; pandas/DuckDB release the GIL in their inner loops
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        summary_future = executor.submit(analytics.get_user_summary, filtered_df)
+        daily_future = executor.submit(analytics.get_daily_activity, filtered_df)
+        heatmap_future = executor.submit(analytics.get_heatmap_data, filtered_df)
+        user_summary = summary_future.result()
+        daily_activity = daily_future.result()
+        heatmap_data = heatmap_future.result()
+    return _ActivityViz(
+        filtered_df=filtered_df,
+        user_summary=user_summary,
+        metrics=analytics.get_summary_metrics(filtered_df, user_summary),
+        daily_activity=daily_activity,
+        heatmap_data=heatmap_data,
+        # Large grids are rasterized from the matrix, so only melt the ones Altair will draw
+        heatmap_melted=(
+            ChartGenerator.melt_heatmap(heatmap_data)
+            if heatmap_data.size <= HEATMAP_RASTER_CELLS else None
+        )
+    )
+
 
 class AuthUI:
     def __init__(self, auth_manager, permission_manager):
@@ -69,16 +112,14 @@ class AuthUI:
         end_date = st.session_state.get('activity_end_date')
         if not start_date or not end_date:
             return
-        filtered_df = analytics.filter_by_date_range(start_date, end_date)
-        if filtered_df.empty:
+        viz = _precompute_viz(logs, start_date, end_date)
+        if viz is None:
             st.warning("No login data found for the selected date range.")
             return
-        user_summary = analytics.get_user_summary(filtered_df)
-        metrics = analytics.get_summary_metrics(filtered_df, user_summary)
-        self._render_metrics(metrics)
-        self._render_user_summary_table(analytics, user_summary)
-        self._render_visualizations(analytics, filtered_df, user_summary)
-        self._render_export_section(analytics, user_summary, filtered_df, start_date, end_date)
+        self._render_metrics(viz.metrics)
+        self._render_user_summary_table(analytics, viz.user_summary)
+        self._render_visualizations(viz)
+        self._render_export_section(analytics, viz.user_summary, viz.filtered_df, start_date, end_date)
     
     def _render_date_filters(self, analytics: UserActivityAnalytics):
         """Render date filter controls"""
@@ -137,27 +178,25 @@ class AuthUI:
         else:
             st.info("No users found matching your search criteria.")
     
-    def _render_visualizations(self, analytics: UserActivityAnalytics, filtered_df: pd.DataFrame, 
-                              user_summary: pd.DataFrame):
+    def _render_visualizations(self, viz: _ActivityViz):
         """Render data visualizations using Altair charts"""
         st.subheader("📈 Activity Visualizations")
-        viz_tab1, viz_tab2, viz_tab3, viz_tab4, viz_tab5 = st.tabs([
-            "📊 User Rankings", 
-            "📈 Daily Trend", 
-            "🗓️ Activity Heatmap", 
-            "🥧 Distribution", 
-            "📉 Frequency"
-        ])
-        with viz_tab1:
-            self._render_user_login_chart(user_summary)
-        with viz_tab2:
-            self._render_daily_activity_chart(analytics, filtered_df)
-        with viz_tab3:
-            self._render_activity_heatmap(analytics, filtered_df)
-        with viz_tab4:
-            self._render_distribution_chart(user_summary)
-        with viz_tab5:
-            self._render_frequency_histogram(user_summary)
+        # st.tabs ships every chart's spec and data on each rerun; render only the selected view
+        renderers = {
+            "📊 User Rankings": lambda: self._render_user_login_chart(viz.user_summary),
+            "📈 Daily Trend": lambda: self._render_daily_activity_chart(viz.daily_activity),
+            "🗓️ Activity Heatmap": lambda: self._render_activity_heatmap(viz.heatmap_data, viz.heatmap_melted),
+            "🥧 Distribution": lambda: self._render_distribution_chart(viz.user_summary),
+            "📉 Frequency": lambda: self._render_frequency_histogram(viz.user_summary)
+        }
+        active_tab = st.radio(
+            "Visualization",
+            list(renderers),
+            horizontal=True,
+            key='active_viz_tab',
+            label_visibility="collapsed"
+        )
+        renderers[active_tab]()
     
     def _render_user_login_chart(self, user_summary: pd.DataFrame):
         """Render user login count chart using Altair"""
@@ -170,9 +209,8 @@ class AuthUI:
         except Exception as e:
             st.error(f"Error rendering user login chart: {str(e)}")
     
-    def _render_daily_activity_chart(self, analytics: UserActivityAnalytics, filtered_df: pd.DataFrame):
+    def _render_daily_activity_chart(self, daily_activity: pd.DataFrame):
         """Render daily activity chart using Altair"""
-        daily_activity = analytics.get_daily_activity(filtered_df)
         if daily_activity.empty:
             st.info("No data available for daily activity.")
             return
@@ -182,14 +220,16 @@ class AuthUI:
         except Exception as e:
             st.error(f"Error rendering daily activity chart: {str(e)}")
     
-    def _render_activity_heatmap(self, analytics: UserActivityAnalytics, filtered_df: pd.DataFrame):
-        """Render user activity heatmap using Altair"""
-        heatmap_data = analytics.get_heatmap_data(filtered_df)
+    def _render_activity_heatmap(self, heatmap_data: pd.DataFrame, heatmap_melted: Optional[pd.DataFrame]):
+        """Render user activity heatmap using Altair, or as an image for large grids"""
         if heatmap_data.empty:
             st.info("No data available for activity heatmap.")
             return
         try:
-            chart = ChartGenerator.create_activity_heatmap(heatmap_data)
+            if heatmap_data.size > HEATMAP_RASTER_CELLS:
+                st.image(ChartGenerator.create_activity_heatmap_image(heatmap_data), use_column_width=True)
+                return
+            chart = ChartGenerator.create_activity_heatmap(heatmap_data, pre_melted=heatmap_melted)
             st.altair_chart(chart, use_container_width=True)
         except Exception as e:
             st.error(f"Error rendering activity heatmap: {str(e)}")
@@ -17,7 +17,7 @@ class FarmerMacRatesUI:
     def render(self):
         """Render complete Farmer Mac rates section"""
         data, timestamp = self.data_processor.load_farm_mac_data()
-        cofi_yearly = pd.DataFrame(data['yearly_resets'])
+        cofi_yearly = pd.DataFrame(data['yearly_resets'], copy=True)
         cofi_3_months = data['monthly_3month_cofi']
         
         st.caption(f"Data fetched at: {timestamp}")
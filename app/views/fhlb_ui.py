@@ -7,6 +7,20 @@ from utils.pdf_generator import generate_pdf_from_df
 from views.glossary import  add_section_glossary, create_term_tooltip
 
 
+@st.cache_data(ttl=3600, show_spinner=False, max_entries=4)
+def _fhlb_summary(timestamp: str, _short_term_df: pd.DataFrame, _long_term_df: pd.DataFrame) -> pd.DataFrame:
+    """Concatenated short/long term table, built once per scrape timestamp"""
+    # The frames come from the same cached scrape as the timestamp, so it alone keys the result
+    return pd.concat([_short_term_df, _long_term_df], ignore_index=True, copy=False, sort=False)
+
+
+@st.cache_data(ttl=3600, show_spinner=False, max_entries=4)
+def _rate_curve_png(timestamp: str, term: str, _fhlb_df: pd.DataFrame) -> bytes:
+    """PNG download of the rate curve, rendered once per scrape and term"""
+    fig = ChartGenerator.create_fhlb_rate_curve(_fhlb_df)
+    return ChartGenerator.save_chart_to_buffer(fig)
+
+
 class FHLBRatesUI:
     """UI components for FHLB rates section"""
     
@@ -20,7 +34,10 @@ class FHLBRatesUI:
         timestamp = rates['timestamp']
         short_term_df = rates['short_term_fixed']
         long_term_df = rates['long_term_fixed']
-        summary_df = pd.concat([short_term_df, long_term_df], ignore_index=True)
+        summary_df = _fhlb_summary(timestamp, short_term_df, long_term_df)
+        # Each term's chart reads a positional slice (a view) of the combined table
+        split = len(short_term_df)
+        term_rows = {"Short Term": slice(None, split), "Long Term": slice(split, None)}
         
         st.caption(f"Data fetched at: {timestamp}")
         st.subheader("📊 FHLB Rates Overview")
@@ -42,18 +59,17 @@ class FHLBRatesUI:
         )
         
         # Term selection and chart
-        choice = st.selectbox("Select Term", ["Short Term", "Long Term"], index=0)
+        choice = st.selectbox("Select Term", list(term_rows), index=0)
         st.subheader("📈 FHLB vs Regular Rate Chart")
         
-        fhlb_df = short_term_df if choice == "Short Term" else long_term_df
-        fig = self.chart_generator.create_fhlb_rate_curve(fhlb_df)
-        st.pyplot(fig)
+        fhlb_df = summary_df.iloc[term_rows[choice]]
+        st.altair_chart(self.chart_generator.create_fhlb_rate_curve_altair(fhlb_df), use_container_width=True)
         
         # Chart download
-        buf = self.chart_generator.save_chart_to_buffer(fig)
+        png_bytes = _rate_curve_png(timestamp, choice, fhlb_df)
         st.download_button(
             label="📥 Download Chart as PNG",
-            data=buf.getvalue(),
+            data=png_bytes,
             file_name="FHLB_rate_curve.png",
             mime="image/png"
         )
@@ -1,11 +1,31 @@
 import streamlit as st
 import pandas as pd
+from datetime import date
 from data_service.data_processor import DataProcessor,  DataFilterer
 from utils.chart_generator import ChartGenerator
 from utils.pdf_generator import generate_pdf_from_df
-from constants.fred import FRED_SERIES_REGISTRY
+from constants.fred import FRED_NAMES, NAME_TO_SERIES_ID
 from views.glossary import add_section_glossary, create_term_tooltip
 
+
+def _series_version(df: pd.DataFrame) -> tuple:
+    """Row count and last observation identify a series revision without hashing the frame"""
+    return len(df), df.index.max().value
+
+
+@st.cache_data(ttl=3600, show_spinner=False, max_entries=32)
+def _month_labels(choice: str, version: tuple, _df: pd.DataFrame) -> list:
+    """YYYY-MM labels of the series' month-start observations, derived once per revision"""
+    return DataFilterer.get_monthly_data(_df).index.strftime('%Y-%m').tolist()
+
+
+@st.cache_data(ttl=3600, show_spinner=False, max_entries=32)
+def _series_chart_png(series_id: str, version: tuple, choice: str, _df: pd.DataFrame) -> bytes:
+    """PNG download of a FRED series chart, rendered once per series revision"""
+    fig = ChartGenerator.create_time_series_chart(_df, f"{choice} Rate Over Time", choice)
+    return ChartGenerator.save_chart_to_buffer(fig)
+
+
 class FredRatesUI:
     """UI components for FRED rates section"""
     
@@ -24,8 +44,9 @@ class FredRatesUI:
         """, unsafe_allow_html=True)
         
         self._render_summary_table()
-        self._render_series_selector()
-        self._render_date_lookup()
+        selected = self._render_series_selector()
+        if selected is not None:
+            self._render_date_lookup(*selected)
     
     def _render_summary_table(self):
         """Render summary data table with download option"""
@@ -43,9 +64,9 @@ class FredRatesUI:
     
     def _render_series_selector(self):
         """Render series selection and chart"""
-        choice = st.selectbox("Select FRED Series", list(FRED_SERIES_REGISTRY.keys()))
+        choice = st.selectbox("Select FRED Series", FRED_NAMES)
         st.session_state['selected_choice'] = choice
-        series_id = FRED_SERIES_REGISTRY[choice]['series_id']
+        series_id = NAME_TO_SERIES_ID[choice]
         df = self.data_processor.load_fred_series(series_id)
         
         if df.empty:
@@ -54,54 +75,47 @@ class FredRatesUI:
         
         st.subheader(f"{choice} Over Time")
         
-        # Create and display chart
-        fig = self.chart_generator.create_time_series_chart(
-            df, f"{choice} Rate Over Time", choice
+        # Display renders client-side; matplotlib only backs the PNG download
+        st.altair_chart(
+            self.chart_generator.create_time_series_altair_chart(df, f"{choice} Rate Over Time", choice),
+            use_container_width=True
         )
-        st.pyplot(fig)
         
         # Download button for chart
-        buf = self.chart_generator.save_chart_to_buffer(fig)
+        png_bytes = _series_chart_png(series_id, _series_version(df), choice, df)
         st.download_button(
             label="📥 Download Chart as PNG",
-            data=buf.getvalue(),
+            data=png_bytes,
             file_name=f"{choice.replace(' ', '_')}_rate_chart.png",
             mime="image/png"
         )
         
         return df, choice
     
-    def _render_date_lookup(self):
-        """Render date lookup tabs"""
-        choice = st.session_state.get('selected_choice', list(FRED_SERIES_REGISTRY.keys())[0])
-        print(f"The choice is: {choice}")
-        series_id = FRED_SERIES_REGISTRY[choice]['series_id']
-        df = self.data_processor.load_fred_series(series_id)
-        
-        if df.empty:
-            return
-        
+    def _render_date_lookup(self, df: pd.DataFrame, choice: str):
+        """Render date lookup tabs for the series already loaded by the selector"""
         st.subheader("🔎 Date Lookup")
         tab1, tab2 = st.tabs(["🔘 Specific Date", "📆 Date Range"])
+        # The series index is sorted, so its bounds are the first and last labels
+        min_date, max_date = df.index[0].date(), df.index[-1].date()
         
         with tab1:
-            self._render_specific_date_lookup(df, choice)
+            self._render_specific_date_lookup(df, choice, min_date, max_date)
         
         with tab2:
-            self._render_date_range_lookup(df, choice)
+            self._render_date_range_lookup(df, choice, min_date, max_date)
     
-    def _render_specific_date_lookup(self, df: pd.DataFrame, choice: str):
+    def _render_specific_date_lookup(self, df: pd.DataFrame, choice: str, min_date: date, max_date: date):
         """Render specific date lookup interface"""
         if "SOFR" in choice:
             date_val = st.date_input(
-                "Select Date", value=df.index.max().date(),
-                min_value=df.index.min().date(), max_value=df.index.max().date(),
+                "Select Date", value=max_date,
+                min_value=min_date, max_value=max_date,
                 key="sofr_date"
             )
             selected = self.filterer.filter_by_date(df, pd.Timestamp(date_val))
         else:
-            monthly = self.filterer.get_monthly_data(df)
-            labels = [d.strftime('%Y-%m') for d in monthly.index]
+            labels = _month_labels(choice, _series_version(df), df)
             sel_str = st.selectbox("Select Month", labels, index=len(labels)-1, key="month_select")
             sel_date = pd.to_datetime(f"{sel_str}-01")
             selected = df.loc[df.index == sel_date]
@@ -112,13 +126,13 @@ class FredRatesUI:
         else:
             st.warning("No data available for the selected date.")
     
-    def _render_date_range_lookup(self, df: pd.DataFrame, choice: str):
+    def _render_date_range_lookup(self, df: pd.DataFrame, choice: str, min_date: date, max_date: date):
         """Render date range lookup interface"""
         date_range = st.date_input(
             "Select Date Range",
-            value=(df.index.min().date(), df.index.max().date()),
-            min_value=df.index.min().date(),
-            max_value=df.index.max().date(),
+            value=(min_date, max_date),
+            min_value=min_date,
+            max_value=max_date,
             key="range_select"
         )
         
@@ -6,39 +6,78 @@ Updated with safe session state management to prevent attribute errors
 
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
-import json
+from matplotlib.figure import Figure
 import io
+from collections import Counter
+from dataclasses import asdict
 from typing import Dict, List, Tuple, Optional
-from constants.glossary_content import financial_rates, quick_terms, sections_terms, introduction, generate_rate_card, style
+from constants.glossary_content import financial_rates, QUICK_TERM_PAIRS, quick_terms, sections_terms, introduction, get_rate_card, style
+from constants import glossary_content
+
+GLOSSARY_PAGE_SIZE = 25
+# Single characters match nearly every description, so quick search waits for a second one
+SEARCH_MIN_CHARS = 2
+CATEGORY_COLORS = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#FFEAA7', 
+                   '#DDA0DD', '#98D8C8', '#F7DC6F', '#BB8FCE', '#85C1E9']
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _category_png(category_counts: Tuple[Tuple[str, int], ...], dpi: int) -> bytes:
+    """Category pie chart as PNG; the glossary is static, so each dpi is drawn once per process"""
+    fig = Figure(figsize=(10, 8))
+    ax = fig.subplots()
+    categories = [category for category, _ in category_counts]
+    counts = [count for _, count in category_counts]
+    
+    wedges, texts, autotexts = ax.pie(counts, labels=categories, autopct='%1.1f%%', 
+                                     colors=CATEGORY_COLORS[:len(categories)], startangle=90)
+    
+    for autotext in autotexts:
+        autotext.set_color('white')
+        autotext.set_fontweight('bold')
+    
+    ax.set_title("Distribution of Financial Rates by Category", 
+                fontsize=16, fontweight='bold', pad=20)
+    fig.tight_layout()
+    
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", dpi=dpi, bbox_inches='tight')
+    return buf.getvalue()
+
+
+@st.cache_data(show_spinner=False)
+def _glossary_csv() -> str:
+    """CSV export of the static glossary, serialized once per process like FINANCIAL_RATES_JSON"""
+    df = pd.DataFrame.from_dict({k: asdict(v) for k, v in financial_rates.items()}, orient='index')
+    return df.to_csv(encoding='utf-8')
 
 
 def safe_session_get(key: str, default=None):
-    """Safely get a session state value with fallback"""
-    try:
-        return getattr(st.session_state, key, default)
-    except AttributeError:
-        return default
+    """Get a session state value with fallback"""
+    # Mapping access is the documented API and never raises for a missing key
+    return st.session_state.get(key, default)
 
 
 def safe_session_set(key: str, value):
-    """Safely set a session state value"""
-    try:
-        setattr(st.session_state, key, value)
-        return True
-    except AttributeError:
-        return False
+    """Set a session state value"""
+    st.session_state[key] = value
+    return True
 
 
 def ensure_session_key(key: str, default=None):
     """Ensure a session state key exists"""
-    if not hasattr(st.session_state, key):
-        safe_session_set(key, default)
+    st.session_state.setdefault(key, default)
 
 
 class FinancialGlossary:
     """Main class to handle the financial glossary with safe session state"""
     
+    IMPACT_ORDER = ("Monetary Policy", "Reference Rate", "Government Securities", 
+                    "Commercial Banking", "Consumer Finance", "Mortgage Finance", 
+                    "Derivative Rate", "Legacy Reference Rate", "Government Sponsored Enterprise",
+                    "Regional Index", "Data Source")
+    _IMPACT_RANK = {category: rank for rank, category in enumerate(IMPACT_ORDER)}
+    
     def __init__(self):
         self.financial_rates = financial_rates
         
@@ -46,6 +85,17 @@ class FinancialGlossary:
         
         self.section_terms = sections_terms
         
+        # The glossary is static, so lookup and statistics indexes are built once per process
+        rates = self.financial_rates
+        self._term_by_upper = {name.upper(): info for name, info in rates.items()}
+        self._lower_name = {name: name.lower() for name in rates}
+        self._lower_desc = {name: info.description.lower() for name, info in rates.items()}
+        self._quick_definitions = dict(QUICK_TERM_PAIRS)
+        self._snippets = {name: info.description[:100] + "..." for name, info in rates.items()}
+        self._categories_sorted = sorted({info.category for info in rates.values()})
+        self._category_counts = Counter(info.category for info in rates.values())
+        self._active_count = sum(1 for info in rates.values() if "legacy" not in info.current_use.lower())
+        
         self._initialize_session_state()
     
     def _initialize_session_state(self):
@@ -70,19 +120,17 @@ class FinancialGlossary:
 
     def get_term_definition(self, term_key: str) -> str:
         """Returns the definition of a glossary term"""
-        for rate_name, rate_info in self.financial_rates.items():
-            if term_key.upper() in rate_name.upper():
-                return rate_info["description"]
+        key_upper = term_key.upper()
+        for name_upper, rate_info in self._term_by_upper.items():
+            if key_upper in name_upper:
+                return rate_info.description
         return "Term not found in the glossary"
 
     def track_term_view(self, term: str):
         """Tracks term views safely"""
-        term_views = safe_session_get('term_views', {})
-        if term in term_views:
-            term_views[term] += 1
-        else:
-            term_views[term] = 1
-        safe_session_set('term_views', term_views)
+        # The stored dict is mutated in place, so there is nothing to write back
+        term_views = st.session_state.setdefault('term_views', {})
+        term_views[term] = term_views.get(term, 0) + 1
 
     def render_sidebar_glossary(self):
         """Renders the quick glossary in the sidebar"""
@@ -91,11 +139,12 @@ class FinancialGlossary:
         st.sidebar.markdown("---")
         st.sidebar.markdown("### 📚 Quick Glossary")
         
-        for term, definition in self.quick_terms.items():
-            with st.sidebar.expander(f"🔍 {term}"):
-                st.markdown(f'<div class="quick-term">{definition}</div>', unsafe_allow_html=True)
-                if st.button(f"⭐ Favorite", key=f"fav_btn_{term}"):
-                    self.toggle_favorite(term)
+        # One selector and button instead of an expander and button per quick term
+        term = st.sidebar.selectbox("🔍 Quick term", list(self._quick_definitions), key="sidebar_quick_term")
+        st.sidebar.markdown(f'<div class="quick-term">{self._quick_definitions[term]}</div>',
+                            unsafe_allow_html=True)
+        if st.sidebar.button("⭐ Favorite", key="fav_btn_quick"):
+            self.toggle_favorite(term)
         
         st.sidebar.markdown("---")
         st.sidebar.markdown("🔍 **Quick Search**")
@@ -107,7 +156,7 @@ class FinancialGlossary:
         )
         safe_session_set('glossary_search_query', search_query)
         
-        if search_query:
+        if len(search_query) >= SEARCH_MIN_CHARS:
             matches = self.search_terms(search_query)
             if matches:
                 st.sidebar.markdown("**Results:**")
@@ -134,17 +183,12 @@ class FinancialGlossary:
         favorite_terms = safe_session_get('favorite_terms', [])
         
         if favorite_terms:
-            for i, term in enumerate(favorite_terms):
-                col1, col2 = st.sidebar.columns([4, 1])
-                with col1:
-                    if st.button(term, key=f"show_fav_{term}_{i}"):
-                        safe_session_set('show_term_detail', term)
-                        self.track_term_view(term)
-                with col2:
-                    if st.button("❌", key=f"remove_fav_{term}_{i}"):
-                        updated_favorites = [t for t in favorite_terms if t != term]
-                        safe_session_set('favorite_terms', updated_favorites)
-                        st.rerun()
+            kept_terms = st.sidebar.multiselect(
+                "Favorites (uncheck to remove)", favorite_terms, default=favorite_terms
+            )
+            if len(kept_terms) < len(favorite_terms):
+                safe_session_set('favorite_terms', kept_terms)
+                st.rerun()
         else:
             st.sidebar.info("No favorite terms")
 
@@ -165,24 +209,28 @@ class FinancialGlossary:
         favorite_terms = safe_session_get('favorite_terms', [])
         
         if term in favorite_terms:
-            updated_favorites = [t for t in favorite_terms if t != term]
-            safe_session_set('favorite_terms', updated_favorites)
+            self._remove_favorite(favorite_terms, term)
             st.success(f"Removed from favorites: {term}")
         else:
             updated_favorites = favorite_terms + [term]
             safe_session_set('favorite_terms', updated_favorites)
             st.success(f"Added to favorites: {term}")
 
+    def _remove_favorite(self, favorite_terms: List[str], term: str):
+        """Stores favorites without term; toggle_favorite never adds a term twice"""
+        updated_favorites = favorite_terms.copy()
+        updated_favorites.remove(term)
+        safe_session_set('favorite_terms', updated_favorites)
+
     def search_terms(self, query: str) -> List[Tuple[str, str]]:
         """Searches for terms in the glossary"""
-        matches = []
+        if len(query) < SEARCH_MIN_CHARS:
+            return []
         search_lower = query.lower()
-        
-        for rate_name, rate_info in self.financial_rates.items():
-            if search_lower in rate_name.lower() or search_lower in rate_info["description"].lower():
-                matches.append((rate_name, rate_info["description"][:100] + "..."))
-        
-        return matches
+        return [
+            (name, self._snippets[name]) for name in self.financial_rates
+            if search_lower in self._lower_name[name] or search_lower in self._lower_desc[name]
+        ]
 
     def add_section_specific_glossary(self, section_name: str):
         """Adds section-specific terms"""
@@ -208,34 +256,24 @@ class FinancialGlossary:
 
     def filter_and_sort_rates(self, selected_category: str, search_term: str, sort_by: str) -> Dict:
         """Filters and sorts rates according to criteria"""
-        filtered_rates = self.financial_rates.copy()
+        rates = self.financial_rates
+        keys = list(rates)
         
         if selected_category != "Todos":
-            filtered_rates = {k: v for k, v in filtered_rates.items() 
-                            if v["category"] == selected_category}
+            keys = [k for k in keys if rates[k].category == selected_category]
         
         if search_term:
             search_lower = search_term.lower()
-            filtered_rates = {
-                k: v for k, v in filtered_rates.items() 
-                if search_lower in k.lower() or search_lower in v["description"].lower()
-            }
-        
+            keys = [k for k in keys if search_lower in self._lower_name[k] or search_lower in self._lower_desc[k]]
         
         if sort_by == "Alfabético":
-            sorted_rates = dict(sorted(filtered_rates.items()))
+            keys.sort()
         elif sort_by == "Por Categoría":
-            sorted_rates = dict(sorted(filtered_rates.items(), key=lambda x: x[1]["category"]))
+            keys.sort(key=lambda k: rates[k].category)
         else:  
-            impact_order = ["Monetary Policy", "Reference Rate", "Government Securities", 
-                          "Commercial Banking", "Consumer Finance", "Mortgage Finance", 
-                          "Derivative Rate", "Legacy Reference Rate", "Government Sponsored Enterprise",
-                          "Regional Index", "Data Source"]
-            sorted_rates = dict(sorted(filtered_rates.items(), 
-                                     key=lambda x: impact_order.index(x[1]["category"]) 
-                                     if x[1]["category"] in impact_order else 999))
+            keys.sort(key=lambda k: self._IMPACT_RANK.get(rates[k].category, 999))
         
-        return sorted_rates
+        return {k: rates[k] for k in keys}
 
     def render_full_glossary(self):
         """Renders the full glossary"""
@@ -251,11 +289,12 @@ class FinancialGlossary:
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
-            categories = ["Todos"] + sorted(list(set([rate["category"] for rate in self.financial_rates.values()])))
+            categories = ["Todos"] + self._categories_sorted
+            current_category = safe_session_get('selected_category', 'Todos')
             selected_category = st.selectbox(
                 "Category", 
                 categories,
-                index=categories.index(safe_session_get('selected_category', 'Todos')) if safe_session_get('selected_category', 'Todos') in categories else 0,
+                index=categories.index(current_category) if current_category in categories else 0,
                 key="full_glossary_category"
             )
             safe_session_set('selected_category', selected_category)
@@ -301,31 +340,45 @@ class FinancialGlossary:
                             st.caption(definition[:100] + "...")
                     with col2:
                         if st.button("❌", key=f"full_remove_fav_{term}_{i}", help="Remove from favorites"):
-                            updated_favorites = [t for t in favorite_terms if t != term]
-                            safe_session_set('favorite_terms', updated_favorites)
+                            self._remove_favorite(favorite_terms, term)
                             st.rerun()
         
-        for rate_name, rate_info in sorted_rates.items():
-            self.render_rate_card(rate_name, rate_info)
+        self.render_rate_cards(sorted_rates)
         
         self.render_summary_statistics()
         self.render_category_chart_matplotlib()
 
-    def render_rate_card(self, rate_name: str, rate_info: Dict):
-        """Renders an individual rate card"""
-        term_name = rate_name.split('(')[0].strip()
-        self.track_term_view(term_name)
-        
-        st.markdown(generate_rate_card(rate_name, rate_info), unsafe_allow_html=True)
-        
-        col1, col2, col3 = st.columns([1, 1, 8])
+    def render_rate_cards(self, sorted_rates: Dict):
+        """Renders one page of rate cards as a single markdown block with shared actions"""
+        names = list(sorted_rates)
+        page_count = max(1, -(-len(names) // GLOSSARY_PAGE_SIZE))
+        page = 1
+        if page_count > 1:
+            # A narrower filter can leave the remembered page past the end
+            if st.session_state.get('glossary_page', 1) > page_count:
+                st.session_state['glossary_page'] = page_count
+            page = st.number_input("Page", min_value=1, max_value=page_count, step=1, key="glossary_page")
+        page_names = names[(page - 1) * GLOSSARY_PAGE_SIZE:page * GLOSSARY_PAGE_SIZE]
+        if not page_names:
+            return
+        
+        # One delta for every card body instead of a markdown element per card
+        st.markdown("".join(get_rate_card(name) for name in page_names), unsafe_allow_html=True)
+        
+        term_names = [name.split('(')[0].strip() for name in page_names]
+        term_views = st.session_state.setdefault('term_views', {})
+        for term_name in term_names:
+            term_views[term_name] = term_views.get(term_name, 0) + 1
+        
+        col1, col2, col3 = st.columns([6, 1, 1])
         with col1:
-            unique_key = f"fav_card_{abs(hash(rate_name))}"
-            if st.button("⭐", key=unique_key, help="Add to favorites"):
-                self.toggle_favorite(term_name)
+            selected_term = st.selectbox("Term", term_names, key="glossary_card_term",
+                                         label_visibility="collapsed")
         with col2:
-            copy_key = f"copy_{abs(hash(rate_name))}"
-            if st.button("📋", key=copy_key, help="Copy definition"):
+            if st.button("⭐", key="fav_card", help="Add to favorites"):
+                self.toggle_favorite(selected_term)
+        with col3:
+            if st.button("📋", key="copy_card", help="Copy definition"):
                 st.info("Definition copied to clipboard")
 
     def render_summary_statistics(self):
@@ -339,13 +392,10 @@ class FinancialGlossary:
             st.metric("Total Rates", len(self.financial_rates))
         
         with col2:
-            categories_count = len(set([rate["category"] for rate in self.financial_rates.values()]))
-            st.metric("Categories", categories_count)
+            st.metric("Categories", len(self._categories_sorted))
         
         with col3:
-            active_rates = len([rate for rate in self.financial_rates.values() 
-                              if "legacy" not in rate["current_use"].lower()])
-            st.metric("Active Rates", active_rates)
+            st.metric("Active Rates", self._active_count)
         
         with col4:
             term_views = safe_session_get('term_views', {})
@@ -356,38 +406,14 @@ class FinancialGlossary:
         """Renders the category distribution chart using matplotlib"""
         st.markdown("### 📊 Category Distribution")
         
-        category_counts = {}
-        for rate_info in self.financial_rates.values():
-            category = rate_info["category"]
-            category_counts[category] = category_counts.get(category, 0) + 1
-        
-        fig, ax = plt.subplots(figsize=(10, 8))
-        
-        categories = list(category_counts.keys())
-        counts = list(category_counts.values())
+        category_counts = tuple(self._category_counts.items())
         
-        colors = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#FFEAA7', 
-                 '#DDA0DD', '#98D8C8', '#F7DC6F', '#BB8FCE', '#85C1E9']
+        # Screen resolution for display, 300 dpi for the download; both are cached after the first draw
+        st.image(_category_png(category_counts, dpi=100))
         
-        wedges, texts, autotexts = ax.pie(counts, labels=categories, autopct='%1.1f%%', 
-                                         colors=colors[:len(categories)], startangle=90)
-        
-        for autotext in autotexts:
-            autotext.set_color('white')
-            autotext.set_fontweight('bold')
-        
-        ax.set_title("Distribution of Financial Rates by Category", 
-                    fontsize=16, fontweight='bold', pad=20)
-        
-        plt.tight_layout()
-        
-        st.pyplot(fig)
-        
-        buf = io.BytesIO()
-        fig.savefig(buf, format="png", dpi=300, bbox_inches='tight')
         st.download_button(
             label="📥 Download Chart",
-            data=buf.getvalue(),
+            data=_category_png(category_counts, dpi=300),
             file_name="category_distribution.png",
             mime="image/png"
         )
@@ -395,20 +421,17 @@ class FinancialGlossary:
     def export_glossary(self, format_type: str):
         """Exports the glossary in different formats"""
         if format_type == "JSON":
-            json_data = json.dumps(self.financial_rates, indent=2, ensure_ascii=False)
             st.download_button(
                 "📥 Download JSON",
-                json_data,
+                glossary_content.FINANCIAL_RATES_JSON,
                 "glossary.json",
                 "application/json",
                 key="download_json"
             )
         elif format_type == "CSV":
-            df = pd.DataFrame.from_dict(self.financial_rates, orient='index')
-            csv = df.to_csv(encoding='utf-8')
             st.download_button(
                 "📥 Download CSV",
-                csv,
+                _glossary_csv(),
                 "glossary.csv",
                 "text/csv",
                 key="download_csv"
@@ -422,16 +445,26 @@ class FinancialGlossary:
         return f'<span class="term-tooltip">{term}</span>'
 
 
-try:
-    glossary = FinancialGlossary()
-except Exception as e:
-    print(f"Warning: Could not initialize glossary: {e}")
-    glossary = None
+_glossary = None
+_glossary_failed = False
+
+
+def _get_glossary() -> Optional[FinancialGlossary]:
+    """Build the shared glossary on first use rather than at import"""
+    global _glossary, _glossary_failed
+    if _glossary is None and not _glossary_failed:
+        try:
+            _glossary = FinancialGlossary()
+        except Exception as e:
+            print(f"Warning: Could not initialize glossary: {e}")
+            _glossary_failed = True
+    return _glossary
 
 
 def render_sidebar_glossary():
     """Convenience function to render the sidebar safely"""
     try:
+        glossary = _get_glossary()
         if glossary:
             return glossary.render_sidebar_glossary()
         else:
@@ -443,6 +476,7 @@ def render_sidebar_glossary():
 def render_full_glossary():
     """Convenience function to render the full glossary safely"""
     try:
+        glossary = _get_glossary()
         if glossary:
             return glossary.render_full_glossary()
         else:
@@ -454,6 +488,7 @@ def render_full_glossary():
 def add_section_glossary(section_name: str):
     """Convenience function to add section-specific terms safely"""
     try:
+        glossary = _get_glossary()
         if glossary:
             return glossary.add_section_specific_glossary(section_name)
     except Exception as e:
@@ -463,6 +498,7 @@ def add_section_glossary(section_name: str):
 def get_term_definition(term: str) -> str:
     """Convenience function to get definitions safely"""
     try:
+        glossary = _get_glossary()
         if glossary:
             return glossary.get_term_definition(term)
         return "Glossary not available"
@@ -473,6 +509,7 @@ def get_term_definition(term: str) -> str:
 def create_term_tooltip(term: str, definition_key: Optional[str] = None) -> str:
     """Convenience function to create tooltips safely"""
     try:
+        glossary = _get_glossary()
         if glossary:
             return glossary.create_term_tooltip(term, definition_key)
         return term
@@ -5,25 +5,56 @@ Contains all Streamlit UI rendering functions
 """
 
 import streamlit as st
+import altair as alt
 import pandas as pd
-from typing import Dict, Tuple
+from datetime import date
+from typing import Dict, Tuple, Optional
 
 from data_service.data_processor import DataProcessor, CustomRateBuilder, DataFilterer
 from utils.chart_generator import ChartGenerator
 from utils.pdf_generator import generate_pdf_from_df
-from constants.fred import FRED_SERIES_REGISTRY
+from constants.fred import FRED_NAMES
 from views.fred_ui import FredRatesUI
 from views.fhlb_ui import FHLBRatesUI
 from views.farmer_mac_ui import FarmerMacRatesUI
 
 
+def _series_fingerprint(series: pd.Series) -> Tuple:
+    """Cheap identity for a custom series: length, date bounds and value sum"""
+    return len(series), series.index[0].value, series.index[-1].value, float(series.sum())
+
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _custom_rate_altair(rate_name: str, fingerprint: Tuple, _series: pd.Series) -> alt.Chart:
+    """On-screen custom rate chart; a hit skips hashing the series for the chart cache"""
+    return ChartGenerator.create_custom_rate_altair_chart(_series, rate_name)
+
+
+# The chart PNG is a pure function of its small keys, so it is kept on disk across restarts
+# (persisted caches ignore ttl; the fingerprint already changes whenever the series does)
+@st.cache_data(persist="disk", show_spinner=False, max_entries=32)
+def _custom_chart_png(rate_name: str, fingerprint: Tuple, _series: pd.Series) -> bytes:
+    """PNG download of a custom rate chart, drawn once per distinct series"""
+    fig = ChartGenerator.create_custom_rate_chart(_series, rate_name)
+    return ChartGenerator.save_chart_to_buffer(fig)
+
+
+# The PDF footer carries a "Generated on" timestamp, so it stays in memory and expires
+@st.cache_data(ttl=3600, show_spinner=False, max_entries=32)
+def _custom_table_pdf(rate_name: str, start_date: date, end_date: date,
+                      fingerprint: Tuple, _named_df: pd.DataFrame) -> bytes:
+    """PDF of a custom rate table slice, keyed without hashing the table itself"""
+    return generate_pdf_from_df(_named_df, title="Custom Rate Table")
+
+
 class CustomRateBuilderUI:
     """UI components for custom rate builder section"""
     
-    def __init__(self, data_processor: DataProcessor, chart_generator: ChartGenerator):
+    def __init__(self, data_processor: DataProcessor, chart_generator: ChartGenerator,
+                 rate_builder: Optional[CustomRateBuilder] = None):
         self.data_processor = data_processor
         self.chart_generator = chart_generator
-        self.rate_builder = CustomRateBuilder(data_processor)
+        self.rate_builder = rate_builder or CustomRateBuilder(data_processor)
         self.filterer = DataFilterer()
     
     def render(self):
@@ -39,9 +70,12 @@ class CustomRateBuilderUI:
     
     def _render_simple_mode(self):
         """Render simple custom rate builder"""
-        selected_base = st.selectbox("Choose base rate", list(FRED_SERIES_REGISTRY.keys()))
-        operation = st.selectbox("Select operation", ["Add", "Subtract", "Multiply", "Divide"])
-        custom_value = st.number_input("Enter custom numeric adjustment", value=0.0)
+        # A form commits its inputs together, so editing them does not rebuild the rate per keystroke
+        with st.form("simple_custom_rate"):
+            selected_base = st.selectbox("Choose base rate", FRED_NAMES)
+            operation = st.selectbox("Select operation", ["Add", "Subtract", "Multiply", "Divide"])
+            custom_value = st.number_input("Enter custom numeric adjustment", value=0.0)
+            st.form_submit_button("Apply")
         
         custom_series, rate_name = self.rate_builder.create_simple_custom_rate(
             selected_base, operation, custom_value
@@ -53,9 +87,7 @@ class CustomRateBuilderUI:
         
         st.markdown(f"Creating: **Custom Rate = {rate_name}**")
         
-        if st.button("💾 Save Custom Rate"):
-            self.rate_builder.save_custom_rate(rate_name, custom_series)
-            st.success(f"Saved: {rate_name}")
+        self._render_save_button(custom_series, rate_name)
         
         self._render_custom_rate_analysis(custom_series, rate_name)
     
@@ -63,11 +95,14 @@ class CustomRateBuilderUI:
         """Render advanced custom rate builder"""
         num_components = st.number_input("How many rates to combine?", min_value=1, max_value=5, step=1, value=2)
         
+        # Widgets in a form report their last submitted values, so unrelated reruns keep the same components
         components = []
-        for i in range(num_components):
-            col = st.selectbox(f"Select Rate {i+1}", list(FRED_SERIES_REGISTRY.keys()), key=f"rate_{i}")
-            weight = st.number_input(f"Weight for {col} (%)", key=f"weight_{i}", value=50.0)
-            components.append((col, weight))
+        with st.form("adv_custom_rate"):
+            for i in range(num_components):
+                col = st.selectbox(f"Select Rate {i+1}", FRED_NAMES, key=f"rate_{i}")
+                weight = st.number_input(f"Weight for Rate {i+1} (%)", key=f"weight_{i}", value=50.0)
+                components.append((col, weight))
+            st.form_submit_button("Build")
         
         custom_series, rate_name = self.rate_builder.create_weighted_custom_rate(components)
         
@@ -77,57 +112,77 @@ class CustomRateBuilderUI:
         
         st.markdown(f"**Formula:** {rate_name}")
         
-        if st.button("💾 Save Custom Rate"):
-            self.rate_builder.save_custom_rate(rate_name, custom_series)
-            st.success(f"Saved: {rate_name}")
+        self._render_save_button(custom_series, rate_name)
         
         self._render_custom_rate_analysis(custom_series, rate_name)
     
+    def _render_save_button(self, custom_series: pd.Series, rate_name: str):
+        """Render the save button; its confirmation comes from session state, not a repeat save"""
+        saved = st.session_state.get('custom_rates', {}).get(rate_name)
+        if st.button("💾 Save Custom Rate", key=f"save_{rate_name}"):
+            # Skip the write when this exact series is already stored under the name
+            if saved is None or not saved.equals(custom_series):
+                self.rate_builder.save_custom_rate(rate_name, custom_series)
+                saved = custom_series
+        if saved is not None:
+            st.success(f"Saved: {rate_name}")
+    
     def _render_custom_rate_analysis(self, custom_series: pd.Series, rate_name: str):
         """Render custom rate chart and analysis tools"""
         # Chart with download
-        fig = self.chart_generator.create_custom_rate_chart(custom_series, rate_name)
-        st.pyplot(fig)
+        st.altair_chart(
+            _custom_rate_altair(rate_name, _series_fingerprint(custom_series), custom_series),
+            use_container_width=True
+        )
         
-        buf = self.chart_generator.save_chart_to_buffer(fig)
+        png_bytes = _custom_chart_png(rate_name, _series_fingerprint(custom_series), custom_series)
         st.download_button(
             label="📥 Download Chart as PNG",
-            data=buf.getvalue(),
+            data=png_bytes,
             file_name=f"{rate_name} Over Time.png",
             mime="image/png"
         )
         
-        # Date analysis tabs
-        tab1, tab2 = st.tabs(["🔘 Specific Date", "📆 Date Range"])
-        
-        with tab1:
-            self._render_custom_specific_date(custom_series)
+        # Custom series are built on a sorted index, so its bounds are the first and last labels
+        min_date, max_date = custom_series.index[0].date(), custom_series.index[-1].date()
         
-        with tab2:
-            self._render_custom_date_range(custom_series, rate_name)
+        # st.tabs runs every pane each rerun; run only the selected analysis (range builds a chart and PDF)
+        renderers = {
+            "🔘 Specific Date": lambda: self._render_custom_specific_date(custom_series, min_date, max_date),
+            "📆 Date Range": lambda: self._render_custom_date_range(custom_series, rate_name, min_date, max_date)
+        }
+        active_view = st.radio(
+            "Date analysis",
+            list(renderers),
+            horizontal=True,
+            key='custom_analysis_view',
+            label_visibility="collapsed"
+        )
+        renderers[active_view]()
     
-    def _render_custom_specific_date(self, custom_series: pd.Series):
+    def _render_custom_specific_date(self, custom_series: pd.Series, min_date: date, max_date: date):
         """Render specific date lookup for custom rates"""
         date_val = st.date_input(
-            "Select Date", value=custom_series.index.max().date(),
-            min_value=custom_series.index.min().date(),
-            max_value=custom_series.index.max().date(),
+            "Select Date", value=max_date,
+            min_value=min_date,
+            max_value=max_date,
             key="custom_date"
         )
-        selected = custom_series[custom_series.index.date == date_val]
+        selected = self.filterer.filter_by_date(custom_series, pd.Timestamp(date_val))
         if not selected.empty:
             st.subheader(f"Custom Rate on {date_val}")
             st.write(selected.iloc[0])
         else:
             st.warning("No data for the selected date.")
     
-    def _render_custom_date_range(self, custom_series: pd.Series, rate_name: str):
+    def _render_custom_date_range(self, custom_series: pd.Series, rate_name: str,
+                                  min_date: date, max_date: date):
         """Render date range analysis for custom rates"""
         date_range = st.date_input(
             "Select Date Range",
-            value=(custom_series.index.min().date(), custom_series.index.max().date()),
-            min_value=custom_series.index.min().date(),
-            max_value=custom_series.index.max().date(),
+            value=(min_date, max_date),
+            min_value=min_date,
+            max_value=max_date,
             key="custom_range"
         )
         
@@ -137,22 +192,23 @@ class CustomRateBuilderUI:
                 st.error("Start date must be before end date.")
                 return
             
-            range_df = custom_series[
-                (custom_series.index.date >= start_date) & 
-                (custom_series.index.date <= end_date)
-            ]
+            range_df = self.filterer.filter_by_date_range(
+                custom_series, pd.Timestamp(start_date), pd.Timestamp(end_date)
+            )
             
             if not range_df.empty:
                 st.subheader(f"Custom Rate from {start_date} to {end_date}")
                 
                 # Range chart
-                fig = self.chart_generator.create_custom_rate_chart(range_df, rate_name)
-                st.pyplot(fig)
+                st.altair_chart(
+                    _custom_rate_altair(rate_name, _series_fingerprint(range_df), range_df),
+                    use_container_width=True
+                )
                 
-                buf = self.chart_generator.save_chart_to_buffer(fig)
+                png_bytes = _custom_chart_png(rate_name, _series_fingerprint(range_df), range_df)
                 st.download_button(
                     label="📥 Download Chart as PNG",
-                    data=buf.getvalue(),
+                    data=png_bytes,
                     file_name=f"{rate_name} from {start_date} to {end_date}.png",
                     mime="image/png",
                     key="custom_range_chart"
@@ -160,12 +216,15 @@ class CustomRateBuilderUI:
                 
                 # Data table
                 st.subheader("Custom Rate Table")
-                named_df = range_df.rename("Custom Rate").to_frame().reset_index()
-                named_df.columns = ["Date", "Custom Rate"]
-                named_df["Date"] = named_df["Date"].dt.strftime("%Y-%m")
+                named_df = pd.DataFrame({
+                    "Date": range_df.index.to_period("M").astype(str),
+                    "Custom Rate": range_df.to_numpy(copy=False)
+                })
                 st.dataframe(named_df)
                 
-                pdf_buf = generate_pdf_from_df(named_df, title="Custom Rate Table")
+                pdf_buf = _custom_table_pdf(
+                    rate_name, start_date, end_date, _series_fingerprint(range_df), named_df
+                )
                 st.download_button(
                     label="📄 Download Custom Rate Dataset As a PDF",
                     data=pdf_buf,
@@ -222,7 +281,7 @@ class AppStateManager:
             st.session_state.custom_rates = {}
         
         if 'selected_choice' not in st.session_state:
-            st.session_state.selected_choice = list(FRED_SERIES_REGISTRY.keys())[0]
+            st.session_state.selected_choice = FRED_NAMES[0]
     
     @staticmethod
     def update_selected_choice(choice: str):
@@ -232,7 +291,8 @@ class AppStateManager:
     @staticmethod
     def get_custom_rates() -> Dict:
         """Get custom rates from session state"""
-        return st.session_state.get('custom_rates', {})
+        # The controller seeds custom_rates on every run, so the key always exists here
+        return st.session_state.custom_rates
     
     @staticmethod
     def clear_custom_rates():
@@ -245,7 +305,9 @@ class UIComponentFactory:
     
     def __init__(self, data_processor: DataProcessor):
         self.data_processor = data_processor
-        self.chart_generator = ChartGenerator()
+        self.chart_generator = get_chart_generator()
+        # Lives as long as the cached factory, so every rerun reuses one builder
+        self.rate_builder = CustomRateBuilder(data_processor)
     
     def create_fred_rates_ui(self) -> FredRatesUI:
         """Create FRED rates UI component"""
@@ -253,7 +315,7 @@ class UIComponentFactory:
     
     def create_custom_rate_builder_ui(self) -> CustomRateBuilderUI:
         """Create custom rate builder UI component"""
-        return CustomRateBuilderUI(self.data_processor, self.chart_generator)
+        return CustomRateBuilderUI(self.data_processor, self.chart_generator, self.rate_builder)
     
     def create_fhlb_rates_ui(self) -> FHLBRatesUI:
         """Create FHLB rates UI component"""
@@ -261,4 +323,16 @@ class UIComponentFactory:
     
     def create_farmer_mac_rates_ui(self) -> FarmerMacRatesUI:
         """Create Farmer Mac rates UI component"""
-        return FarmerMacRatesUI(self.data_processor, self.chart_generator)
\ No newline at end of file
+        return FarmerMacRatesUI(self.data_processor, self.chart_generator)
+
+
+@st.cache_resource
+def get_chart_generator() -> ChartGenerator:
+    """Get the process-wide chart generator"""
+    return ChartGenerator()
+
+
+@st.cache_resource
+def get_ui_factory(fred_api_key: Optional[str], fred_base_url: str) -> UIComponentFactory:
+    """Get the process-wide UI factory and its data processor for a FRED configuration"""
+    return UIComponentFactory(DataProcessor(fred_api_key=fred_api_key, fred_base_url=fred_base_url))